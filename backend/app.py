@@ -19,9 +19,8 @@ Then visit http://localhost:8000/docs to see API documentation
 """
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from contextlib import contextmanager
 import uvicorn
 import os
@@ -32,84 +31,118 @@ from routes.auth import router as auth_router
 load_dotenv()
 
 # Import configuration
-from config import DATABASE_URL, BACKEND_URL, FRONTEND_URL
+from config import BACKEND_URL, FRONTEND_URL, RUN_MIGRATIONS, ENV, RELOAD, WORKERS, BACKLOG
 
 # Import database models
 from models import Base, User, UserProfile, Listing, Message, Review, SellerProof
 
+# Import middleware
+from middleware.cors import FastCORS
+from middleware.health import HealthCheck
+
 # ============================================================================
 # DATABASE SETUP
 # ============================================================================
 
-# Create database engine
-# This is like creating a connection pool to PostgreSQL
-engine = create_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True to see SQL queries in terminal (useful for debugging)
-    future=True
-)
-
-# Create session factory
-# Sessions manage database transactions (like one conversation with the database)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The engine (connection pool) and session factory live in db.py so the
+# whole app shares ONE pool (app.py only needs the engine, for create_tables)
+from db import engine
+from utils.auth_cache import AuthCache
 
-# Create all tables if they don't exist
-# This reads your models (User, Listing, etc.) and creates tables in the database
-Base.metadata.create_all(bind=engine)
+# Tables are NOT created at import time any more.
+# create_all costs a round-trip per table, and it used to run on every
+# worker boot and every --reload. Set RUN_MIGRATIONS=1 to have it run once
+# at startup (see create_tables below), or load database/schema.sql.
 
 # ============================================================================
 # FASTAPI APP SETUP
 # ============================================================================
 
+# In production we don't serve Swagger UI / ReDoc / openapi.json at all
+IS_PROD = ENV == "prod"
+
 app = FastAPI(
     title="Ticket Resale API",
     description="A peer-to-peer ticket resale platform without fees",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # orjson encodes JSON in C (much faster than json.dumps)
+    docs_url=None if IS_PROD else "/docs",
+    redoc_url=None if IS_PROD else "/redoc",
+    openapi_url=None if IS_PROD else "/openapi.json"
 )
 
+# Per-process auth caches (decoded tokens, users, /me bodies) — see utils/auth_cache.py
+app.state.auth_cache = AuthCache()
+
+@app.on_event("startup")
+async def create_tables():
+    """
+    Create all tables if they don't exist (only when RUN_MIGRATIONS=1).
+    
+    This reads your models (User, Listing, etc.) and creates tables in the database.
+    
+    With several Uvicorn workers every worker runs startup, so we take a
+    Postgres advisory lock first: one worker creates the tables, the others
+    wait and then find nothing left to do.
+    """
+    if not RUN_MIGRATIONS:
+        return
+    
+    async with engine.begin() as conn:
+        # Released automatically when this transaction ends
+        await conn.execute(text("SELECT pg_advisory_xact_lock(1)"))
+        # create_all is sync-only; run_sync hands it a sync view of this connection
+        await conn.run_sync(Base.metadata.create_all)
+
+@app.on_event("startup")
+def prime_openapi_schema():
+    """
+    Build the OpenAPI schema now instead of during the first /docs request.
+    
+    FastAPI caches it after the first build, but that first build is slow
+    (hundreds of ms), so we pay it at boot rather than on a user's request.
+    """
+    if not IS_PROD:
+        app.openapi()
+
 # ============================================================================
 # CORS SETUP
 # ============================================================================
 # CORS = Cross-Origin Resource Sharing
 # This allows your React frontend (localhost:3000) to make requests to this backend (localhost:8000)
 # Without this, browsers block requests from different domains
+#
+# FastCORS (middleware/cors.py) is a pure-ASGI middleware: it allows all
+# methods and echoes requested headers, and answers preflights itself.
 
 app.add_middleware(
-    CORSMiddleware,
+    FastCORS,
     allow_origins=[
         "http://localhost:3000",  # Local React development
         "http://localhost:8000",  # Local backend
         FRONTEND_URL,              # From .env
     ],
     allow_credentials=True,        # Allow cookies
-    allow_methods=["*"],           # Allow all HTTP methods (GET, POST, etc.)
-    allow_headers=["*"],           # Allow all headers
 )
 
 # ============================================================================
-# DEPENDENCY: Get Database Session
+# HEALTH CHECK
 # ============================================================================
+# GET /health is answered by HealthCheck (middleware/health.py) before the
+# request reaches CORS or the router — load balancers poll it constantly.
+# Middleware added last runs first, so keep this below every other add_middleware.
 
-def get_db():
+app.add_middleware(HealthCheck)
+
+@app.get("/health")
+def health_check():
     """
-    Creates a database session for each request.
-    
-    FastAPI will automatically:
-    1. Call this function before each endpoint
-    2. Inject the session into the endpoint
-    3. Close the session after the endpoint finishes
+    Health check endpoint (useful for monitoring).
     
-    Usage in an endpoint:
-        @app.get("/users/{user_id}")
-        def get_user(user_id: int, db: Session = Depends(get_db)):
-            user = db.query(User).filter(User.id == user_id).first()
-            return user
+    GET/HEAD never get here — HealthCheck answers them first. The route keeps
+    /health in the docs and lets other methods get a 405 from the router.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    return {"status": "healthy"}
 
 # ============================================================================
 # TEST ROUTE
@@ -128,14 +161,6 @@ def read_root():
         "health": "OK"
     }
 
-@app.get("/health")
-def health_check():
-    """
-    Health check endpoint (useful for monitoring).
-    Returns OK if server is running.
-    """
-    return {"status": "healthy"}
-
 # ============================================================================
 # ROUTE IMPORTS (When you create them)
 # ============================================================================
@@ -159,6 +184,7 @@ app.include_router(users_router, prefix="/api/users", tags=["Users"])
 if __name__ == "__main__":
     """
     This block runs when you execute: python app.py
+    (In production use Gunicorn instead — see gunicorn.conf.py)
     
     uvicorn is the ASGI server that actually runs FastAPI
     
@@ -166,11 +192,20 @@ if __name__ == "__main__":
     - app: The FastAPI application instance
     - host: Which IP to bind to (0.0.0.0 = accessible from anywhere)
     - port: Which port to run on (8000)
-    - reload: Auto-restart when files change (great for development)
+    - reload: Auto-restart when files change (set RELOAD=1 for development)
+    - workers: Number of processes (default: one per CPU core).
+      Ignored by uvicorn when reload is on.
+    - backlog: Max queued connections waiting to be accepted
+    - loop/http: "auto" picks uvloop and httptools (the fast C/Cython
+      implementations) when installed — uvicorn[standard] installs them
     """
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=RELOAD,
+        workers=WORKERS,
+        backlog=BACKLOG,
+        loop="auto",
+        http="auto"
     )
\ No newline at end of file
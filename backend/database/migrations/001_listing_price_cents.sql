@@ -0,0 +1,12 @@
+-- Store listing prices as integer cents instead of DECIMAL(10, 2)
+-- Run once against an existing database created from the old schema.sql:
+--   psql -U postgres -d ticket_app -f database/migrations/001_listing_price_cents.sql
+
+BEGIN;
+
+ALTER TABLE listings ADD COLUMN price_cents INTEGER;
+UPDATE listings SET price_cents = ROUND(price * 100)::int;
+ALTER TABLE listings ALTER COLUMN price_cents SET NOT NULL;
+ALTER TABLE listings DROP COLUMN price;
+
+COMMIT;
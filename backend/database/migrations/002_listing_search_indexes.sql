@@ -0,0 +1,18 @@
+-- Indexes for the GET /api/listings filters
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/002_listing_search_indexes.sql
+--
+-- The trigram (pg_trgm) indexes are only created here / in schema.sql, not by
+-- the models' create_all(), because they need the extension installed first.
+
+BEGIN;
+
+-- is_available = true ... ORDER BY concert_date  ->  index range scan, no sort
+CREATE INDEX IF NOT EXISTS ix_listings_available_date ON listings(is_available, concert_date);
+
+-- artist_name / venue_name ILIKE '%...%'
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS ix_listings_artist_trgm ON listings USING gin (artist_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_listings_venue_trgm ON listings USING gin (venue_name gin_trgm_ops);
+
+COMMIT;
@@ -0,0 +1,16 @@
+-- Message indexes for the unread badge and conversation view
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/003_message_indexes.sql
+
+BEGIN;
+
+-- Unread count / unread inbox: WHERE receiver_id = ? AND is_read = false
+-- Replaces the old (receiver_id, is_read) index with a partial one that
+-- only holds unread messages
+DROP INDEX IF EXISTS ix_messages_receiver_unread;
+CREATE INDEX ix_messages_receiver_unread ON messages(receiver_id) WHERE is_read = false;
+
+-- Conversation between two users, read in created_at order (no sort step)
+CREATE INDEX IF NOT EXISTS ix_messages_pair_created ON messages(sender_id, receiver_id, created_at DESC);
+
+COMMIT;
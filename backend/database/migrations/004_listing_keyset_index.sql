@@ -0,0 +1,11 @@
+-- Keyset pagination for GET /api/listings orders by (concert_date, id)
+-- Add id to the browse index so the cursor comparison is a pure index range scan
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/004_listing_keyset_index.sql
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_listings_available_date;
+CREATE INDEX ix_listings_available_date ON listings(is_available, concert_date, id);
+
+COMMIT;
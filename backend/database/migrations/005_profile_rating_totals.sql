@@ -0,0 +1,23 @@
+-- Keep a running rating_sum / rating_count on user_profiles so a new review
+-- updates the seller's average in O(1) instead of re-running AVG over all reviews
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/005_profile_rating_totals.sql
+
+BEGIN;
+
+ALTER TABLE user_profiles ADD COLUMN rating_sum INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE user_profiles ADD COLUMN rating_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill from the reviews written so far
+UPDATE user_profiles p
+SET rating_sum = r.rating_sum,
+    rating_count = r.rating_count,
+    average_rating = r.rating_sum::float / r.rating_count
+FROM (
+    SELECT reviewed_user_id, SUM(rating) AS rating_sum, COUNT(*) AS rating_count
+    FROM reviews
+    GROUP BY reviewed_user_id
+) r
+WHERE p.user_id = r.reviewed_user_id;
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- Review and seller-proof indexes for the profile page
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/006_review_proof_indexes.sql
+
+BEGIN;
+
+-- A seller's reviews, newest first (no sort step for the paginated list)
+CREATE INDEX IF NOT EXISTS ix_reviews_reviewed_created ON reviews(reviewed_user_id, created_at DESC);
+
+-- A seller's proof images, newest first
+CREATE INDEX IF NOT EXISTS ix_seller_proof_seller_created ON seller_proof(seller_id, created_at DESC);
+
+COMMIT;
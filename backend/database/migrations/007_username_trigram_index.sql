@@ -0,0 +1,13 @@
+-- Trigram index for GET /api/users/search (username ILIKE '%...%')
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/007_username_trigram_index.sql
+--
+-- Like the listing trigram indexes, this one is only created here / in
+-- schema.sql, not by the models' create_all(), because it needs pg_trgm.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS ix_users_username_trgm ON users USING gin (username gin_trgm_ops);
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Keyset pagination for GET /api/users/{id}/proof orders by (created_at DESC, id DESC)
+-- Add id to the seller-proof index so the cursor comparison is a pure index range scan
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/008_seller_proof_keyset_index.sql
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_seller_proof_seller_created;
+CREATE INDEX ix_seller_proof_seller_created ON seller_proof(seller_id, created_at DESC, id DESC);
+
+COMMIT;
@@ -0,0 +1,14 @@
+-- Keep reviews when their listing is deleted (listing_id becomes NULL)
+-- Reviews feed user_profiles.rating_sum / rating_count, so they must not
+-- disappear with the listing. schema.sql already declares ON DELETE SET NULL;
+-- this makes databases created from the models (create_all) match.
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/009_review_listing_set_null.sql
+
+BEGIN;
+
+ALTER TABLE reviews DROP CONSTRAINT IF EXISTS reviews_listing_id_fkey;
+ALTER TABLE reviews ADD CONSTRAINT reviews_listing_id_fkey
+    FOREIGN KEY (listing_id) REFERENCES listings(id) ON DELETE SET NULL;
+
+COMMIT;
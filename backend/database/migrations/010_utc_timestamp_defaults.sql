@@ -0,0 +1,20 @@
+-- Store created_at / updated_at in UTC regardless of the server's TimeZone
+-- The columns are naive TIMESTAMPs holding UTC. CURRENT_TIMESTAMP / now() is
+-- converted to the session TimeZone when stored in such a column, so on a
+-- server not set to UTC new rows would be written in local time.
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/010_utc_timestamp_defaults.sql
+
+BEGIN;
+
+ALTER TABLE users ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE users ALTER COLUMN updated_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE user_profiles ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE user_profiles ALTER COLUMN updated_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE listings ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE listings ALTER COLUMN updated_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE messages ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE reviews ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+ALTER TABLE seller_proof ALTER COLUMN created_at SET DEFAULT (now() AT TIME ZONE 'utc');
+
+COMMIT;
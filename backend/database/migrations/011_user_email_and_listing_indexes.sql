@@ -0,0 +1,27 @@
+-- Case-insensitive unique email + listing lookup indexes
+-- Run once against an existing database:
+--   psql -U postgres -d ticket_app -f database/migrations/011_user_email_and_listing_indexes.sql
+--
+-- These are declared on the models and in schema.sql, but create_all() only
+-- creates indexes together with a new table, so existing databases need them
+-- added here.
+--
+-- NOTE: ix_users_email_lower is UNIQUE, so it fails if two users already have
+-- emails that differ only by case (e.g. Bob@x.com and bob@x.com). Find them with
+--   SELECT lower(email), array_agg(id ORDER BY id) FROM users
+--   GROUP BY lower(email) HAVING count(*) > 1;
+-- then merge or delete the extra accounts (or change their email) and re-run
+-- this file.
+
+BEGIN;
+
+-- Login and signup: WHERE lower(email) = lower(?), one account per address
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_lower ON users (lower(email));
+
+-- Seller's active listings: WHERE seller_id = ? AND is_available = true
+CREATE INDEX IF NOT EXISTS ix_listings_seller_available ON listings (seller_id, is_available);
+
+-- Artist search sorted by date
+CREATE INDEX IF NOT EXISTS ix_listings_artist_date ON listings (artist_name, concert_date);
+
+COMMIT;
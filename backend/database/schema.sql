@@ -5,8 +5,8 @@ CREATE TABLE users (
     email VARCHAR(120) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
     is_verified BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create user profiles table
@@ -18,8 +18,10 @@ CREATE TABLE user_profiles (
     total_sales INTEGER DEFAULT 0,
     is_verified_seller BOOLEAN DEFAULT FALSE,
     average_rating FLOAT DEFAULT 0.0,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create listings table
@@ -32,12 +34,12 @@ CREATE TABLE listings (
     section VARCHAR(50),
     row VARCHAR(10),
     seat_number VARCHAR(10),
-    price DECIMAL(10, 2) NOT NULL,
+    price_cents INTEGER NOT NULL,
     quantity_available INTEGER DEFAULT 1,
     description TEXT,
     is_available BOOLEAN DEFAULT TRUE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc'),
+    updated_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create messages table
@@ -48,7 +50,7 @@ CREATE TABLE messages (
     listing_id INTEGER REFERENCES listings(id) ON DELETE SET NULL,
     message_text TEXT NOT NULL,
     is_read BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create reviews table
@@ -59,7 +61,7 @@ CREATE TABLE reviews (
     listing_id INTEGER REFERENCES listings(id) ON DELETE SET NULL,
     rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
     comment TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create seller proof table (for past sales proof)
@@ -68,7 +70,7 @@ CREATE TABLE seller_proof (
     seller_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
     proof_image_url VARCHAR(500) NOT NULL,
     description VARCHAR(255),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT (now() AT TIME ZONE 'utc')
 );
 
 -- Create indexes for better query performance
@@ -78,4 +80,18 @@ CREATE INDEX idx_listings_concert_date ON listings(concert_date);
 CREATE INDEX idx_messages_sender_id ON messages(sender_id);
 CREATE INDEX idx_messages_receiver_id ON messages(receiver_id);
 CREATE INDEX idx_reviews_reviewed_user_id ON reviews(reviewed_user_id);
-CREATE INDEX idx_seller_proof_seller_id ON seller_proof(seller_id);
\ No newline at end of file
+CREATE INDEX idx_seller_proof_seller_id ON seller_proof(seller_id);
+CREATE UNIQUE INDEX ix_users_email_lower ON users(lower(email));
+CREATE INDEX ix_listings_seller_available ON listings(seller_id, is_available);
+CREATE INDEX ix_listings_artist_date ON listings(artist_name, concert_date);
+CREATE INDEX ix_messages_receiver_unread ON messages(receiver_id) WHERE is_read = false;
+CREATE INDEX ix_messages_pair_created ON messages(sender_id, receiver_id, created_at DESC);
+CREATE INDEX ix_listings_available_date ON listings(is_available, concert_date, id);
+CREATE INDEX ix_reviews_reviewed_created ON reviews(reviewed_user_id, created_at DESC);
+CREATE INDEX ix_seller_proof_seller_created ON seller_proof(seller_id, created_at DESC, id DESC);
+
+-- Trigram indexes so ILIKE '%taylor%' searches can use an index
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX ix_listings_artist_trgm ON listings USING gin (artist_name gin_trgm_ops);
+CREATE INDEX ix_listings_venue_trgm ON listings USING gin (venue_name gin_trgm_ops);
+CREATE INDEX ix_users_username_trgm ON users USING gin (username gin_trgm_ops);
@@ -0,0 +1,72 @@
+"""
+Database Setup
+==============
+
+The ONE place where the database engine and sessions are created.
+
+WHY A SEPARATE FILE:
+- Every create_engine() call builds its own connection pool
+- If app.py and each route file made their own engine, each worker would
+  hold several pools (and several times as many Postgres connections)
+- Routes and app.py both import from here, so there is a single shared pool
+
+Usage in a route:
+    from db import get_db
+
+    @router.get("/things")
+    async def get_things(db: AsyncSession = Depends(get_db)):
+        things = (await db.scalars(select(Thing))).all()
+
+ASYNC ONLY:
+- Sessions are AsyncSessions backed by asyncpg
+- Every router is `async def`, so DB waits don't tie up a threadpool
+  thread — requests share the event loop while they await Postgres
+- There is no sync engine any more (one pool per worker, not two)
+"""
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from config import (
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DB_QUERY_CACHE_SIZE, DB_PREPARED_STATEMENT_CACHE_SIZE,
+)
+
+# ============================================================================
+# ENGINE (connection pool)
+# ============================================================================
+
+engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,  # Set to True to see SQL queries in terminal (useful for debugging)
+    pool_size=DB_POOL_SIZE,          # Connections kept open
+    max_overflow=DB_MAX_OVERFLOW,    # Extra connections allowed under burst load
+    pool_timeout=DB_POOL_TIMEOUT,    # Seconds to wait for a free connection
+    pool_recycle=DB_POOL_RECYCLE,    # Replace connections before they go stale
+    pool_pre_ping=True,              # Detect dead connections before using them
+    query_cache_size=DB_QUERY_CACHE_SIZE,  # Compiled-SQL cache (every filter combination is one entry)
+    # Server-side prepared statements per connection (asyncpg's default is 100)
+    connect_args={"prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE}
+)
+
+# Create session factory
+# Sessions manage database transactions (like one conversation with the database)
+# expire_on_commit=False: objects stay usable after commit without another
+# SELECT (an implicit refresh would need an await we can't do on attribute access)
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+# ============================================================================
+# DEPENDENCY: Get Database Session
+# ============================================================================
+
+async def get_db():
+    """
+    Creates a database session for each request.
+
+    FastAPI will automatically:
+    1. Call this function before each endpoint
+    2. Inject the session into the endpoint
+    3. Close the session after the endpoint finishes
+    """
+    async with SessionLocal() as db:
+        yield db
@@ -0,0 +1,30 @@
+"""
+Gunicorn Config (production)
+============================
+
+Runs the FastAPI app with Gunicorn supervising Uvicorn worker processes.
+
+RUN WITH (from backend/):
+    gunicorn app:app -c gunicorn.conf.py
+
+WHY GUNICORN:
+- Restarts crashed workers
+- The master binds the port ONCE; every forked worker accepts from that
+  same shared socket (there is one accept queue, not one per worker)
+- backlog: size of that shared queue — a bigger one absorbs connection
+  bursts instead of refusing them while workers are busy
+- reuse_port: only sets SO_REUSEPORT on the listener so another process
+  (e.g. a new master during a deploy) can bind the same port; it does NOT
+  spread connections across workers
+
+TCP_NODELAY is already set by asyncio/uvloop on every connection, so small
+JSON responses are not held back by Nagle's algorithm.
+"""
+
+from config import WORKERS, BACKLOG
+
+bind = "0.0.0.0:8000"
+workers = WORKERS
+worker_class = "uvicorn.workers.UvicornWorker"
+reuse_port = True
+backlog = BACKLOG
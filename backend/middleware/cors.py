@@ -0,0 +1,120 @@
+"""
+CORS Middleware
+===============
+
+A small pure-ASGI replacement for Starlette's CORSMiddleware.
+
+WHY WE NEED THIS:
+- CORS runs on EVERY request, so it should be as cheap as possible
+- We only ever need a fixed list of origins + credentials, not the full
+  feature set (regex origins, expose_headers, max_age tuning, ...)
+- Working directly on the ASGI scope avoids building Request/Headers objects
+
+HOW IT WORKS:
+1. Non-HTTP traffic (websockets, lifespan) is passed straight through
+2. The Origin header is pulled out of scope["headers"] in one scan
+3. Preflight (OPTIONS + Access-Control-Request-Method) is answered here
+   with a 204 — the app is never called
+4. For normal requests from an allowed origin, we wrap `send` and append
+   the CORS headers to the response start message
+"""
+
+# ============================================================================
+# CONSTANT HEADERS (encoded once at import time)
+# ============================================================================
+
+_ALLOW_METHODS = (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT")
+_ALLOW_CREDENTIALS = (b"access-control-allow-credentials", b"true")
+_MAX_AGE = (b"access-control-max-age", b"600")
+_VARY_ORIGIN = (b"vary", b"Origin")
+
+
+class FastCORS:
+    """
+    Pure-ASGI CORS middleware.
+
+    Usage:
+        app.add_middleware(FastCORS, allow_origins=[...], allow_credentials=True)
+    """
+
+    def __init__(self, app, allow_origins, allow_credentials: bool = False):
+        self.app = app
+        # Pre-encode so we can compare against raw header bytes
+        self._origins = {o.encode() for o in allow_origins if o}
+        self._allow_credentials = allow_credentials
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Single pass over the raw headers
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a cross-origin request — nothing to do
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = origin in self._origins
+
+        # Preflight request: answer it ourselves
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, allowed, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._simple_headers(origin)
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _simple_headers(self, origin: bytes) -> list:
+        """Headers added to a normal (non-preflight) response"""
+        headers = [(b"access-control-allow-origin", origin), _VARY_ORIGIN]
+        if self._allow_credentials:
+            headers.append(_ALLOW_CREDENTIALS)
+        return headers
+
+    async def _preflight(self, send, origin: bytes, allowed: bool, request_headers):
+        """Send the preflight response without invoking the app"""
+        if not allowed:
+            body = b"Disallowed CORS origin"
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    _VARY_ORIGIN,
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = self._simple_headers(origin)
+        headers.append(_ALLOW_METHODS)
+        headers.append(_MAX_AGE)
+        # We allow all headers, so just echo back what the browser asked for
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,60 @@
+"""
+Health Check Middleware
+=======================
+
+Answers GET (and HEAD) /health directly at the ASGI level.
+
+WHY WE NEED THIS:
+- Load balancers hit /health many times per second
+- Going through FastAPI means routing, dependency injection and response
+  building — all for a body that never changes
+- This middleware sits outermost, so the probe never reaches CORS, the
+  router, or any endpoint code
+
+HOW IT WORKS:
+1. If the request is an HTTP GET/HEAD and the path is exactly /health,
+   send the pre-encoded response and stop
+2. Everything else is passed to the app untouched (so POST /health etc.
+   get the router's normal 405)
+"""
+
+# ============================================================================
+# CONSTANT RESPONSE (encoded once at import time)
+# ============================================================================
+
+_HEALTH_PATH = "/health"
+_HEALTH_METHODS = ("GET", "HEAD")
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode()),
+    ],
+}
+_HEALTH_RESPONSE_BODY = {"type": "http.response.body", "body": _HEALTH_BODY}
+
+
+class HealthCheck:
+    """
+    Pure-ASGI /health responder.
+
+    Usage (add it LAST so it is the outermost middleware):
+        app.add_middleware(HealthCheck)
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"] == _HEALTH_PATH
+            and scope["method"] in _HEALTH_METHODS
+        ):
+            await send(_HEALTH_START)
+            await send(_HEALTH_RESPONSE_BODY)
+            return
+
+        await self.app(scope, receive, send)
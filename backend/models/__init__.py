@@ -2,6 +2,20 @@ from sqlalchemy.orm import declarative_base # type: ignore
 
 Base = declarative_base()
 
+from sqlalchemy import func
+
+def utc_now():
+    """
+    SQL for "current time in UTC" (timezone('UTC', now())).
+    
+    Timestamp columns are naive TIMESTAMP holding UTC (what datetime.utcnow
+    used to write). Plain now() is a timestamptz, and Postgres converts it to
+    the session's TimeZone when storing it in a naive column — on a server
+    not set to UTC that would be local time. Use this for every
+    server_default / onupdate instead.
+    """
+    return func.timezone("UTC", func.now())
+
 from models.user import User, UserProfile
 from models.listing import Listing
 from models.message import Message
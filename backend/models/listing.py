@@ -7,13 +7,13 @@ Represents a ticket listing (a ticket for sale).
 Database table: listings
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Numeric, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
-from datetime import datetime
-from models import Base
+from models import Base, utc_now
 
 class Listing(Base):
     __tablename__ = "listings"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -31,7 +31,9 @@ class Listing(Base):
     seat_number = Column(String(10), nullable=True)
     
     # Price and availability
-    price = Column(Numeric(10, 2), nullable=False)  # Price in dollars (e.g., 150.50)
+    # Stored as whole cents (e.g., 15050 = $150.50)
+    # Integers are exact and much cheaper to load/serialize than Decimal
+    price_cents = Column(Integer, nullable=False)
     quantity_available = Column(Integer, default=1)
     
     # Additional info
@@ -39,13 +41,28 @@ class Listing(Base):
     is_available = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     
     # Relationships
     seller = relationship("User", back_populates="listings")
     messages = relationship("Message", back_populates="listing", cascade="all, delete-orphan")
-    reviews = relationship("Review", back_populates="listing", cascade="all, delete-orphan")
+    # Reviews outlive the listing: they count towards the seller's rating_sum /
+    # rating_count, so deleting a listing must not delete them. Postgres sets
+    # reviews.listing_id to NULL (ON DELETE SET NULL); the ORM leaves them alone.
+    reviews = relationship("Review", back_populates="listing", passive_deletes=True)
+    
+    # Composite indexes matching the real query shapes
+    __table_args__ = (
+        Index("ix_listings_available_date", "is_available", "concert_date", "id"),  # Browse page: available, sorted by date (+ id for the cursor)
+        Index("ix_listings_seller_available", "seller_id", "is_available"),  # Seller's active listings
+        Index("ix_listings_artist_date", "artist_name", "concert_date"),  # Artist search sorted by date
+    )
+    
+    @property
+    def price(self) -> float:
+        """Price in dollars (e.g., 150.50) — for display / API responses"""
+        return self.price_cents / 100
     
     def __repr__(self):
-        return f"<Listing(id={self.id}, artist='{self.artist_name}', price={self.price})>"
+        return f"<Listing(id={self.id}, artist='{self.artist_name}', price_cents={self.price_cents})>"
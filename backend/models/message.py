@@ -7,13 +7,13 @@ Represents a direct message between two users (buyer and seller).
 Database table: messages
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
-from datetime import datetime
-from models import Base
+from models import Base, utc_now
 
 class Message(Base):
     __tablename__ = "messages"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -27,12 +27,20 @@ class Message(Base):
     is_read = Column(Boolean, default=False)
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
     
     # Relationships
     sender = relationship("User", foreign_keys=[sender_id], back_populates="sent_messages")
     receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_messages")
     listing = relationship("Listing", back_populates="messages")
     
+    __table_args__ = (
+        # Unread badge / inbox: WHERE receiver_id = ? AND is_read = false
+        # Partial index — only unread rows are in it, so it stays tiny
+        Index("ix_messages_receiver_unread", "receiver_id", postgresql_where=text("is_read = false")),
+        # One conversation in time order: WHERE sender_id = ? AND receiver_id = ? ORDER BY created_at
+        Index("ix_messages_pair_created", "sender_id", "receiver_id", text("created_at DESC")),
+    )
+    
     def __repr__(self):
         return f"<Message(id={self.id}, from_user={self.sender_id}, to_user={self.receiver_id})>"
@@ -7,32 +7,37 @@ Represents a review/rating left by a buyer for a seller.
 Database table: reviews
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.orm import relationship
-from datetime import datetime
-from models import Base
+from models import Base, utc_now
 
 class Review(Base):
     __tablename__ = "reviews"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     id = Column(Integer, primary_key=True, index=True)
     
     # Foreign keys
     reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     reviewed_user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    listing_id = Column(Integer, ForeignKey("listings.id"), nullable=True)
+    listing_id = Column(Integer, ForeignKey("listings.id", ondelete="SET NULL"), nullable=True)
     
     # Review content
     rating = Column(Integer, nullable=False)  # 1-5 stars
     comment = Column(Text, nullable=True)
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
     
     # Relationships
     reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="reviews_given")
     reviewed_user = relationship("User", foreign_keys=[reviewed_user_id], back_populates="reviews_received")
     listing = relationship("Listing", back_populates="reviews")
     
+    __table_args__ = (
+        # A seller's reviews, newest first: WHERE reviewed_user_id = ? ORDER BY created_at DESC
+        Index("ix_reviews_reviewed_created", "reviewed_user_id", text("created_at DESC")),
+    )
+    
     def __repr__(self):
         return f"<Review(id={self.id}, rating={self.rating}, reviewer={self.reviewer_id})>"
\ No newline at end of file
@@ -7,13 +7,13 @@ Represents proof of past sales (screenshots) to build seller credibility.
 Database table: seller_proof
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
-from datetime import datetime
-from models import Base
+from models import Base, utc_now
 
 class SellerProof(Base):
     __tablename__ = "seller_proof"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -25,10 +25,16 @@ class SellerProof(Base):
     description = Column(String(255), nullable=True)
     
     # Timestamp
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
     
     # Relationship
     seller = relationship("User", back_populates="proof_images")
     
+    __table_args__ = (
+        # A seller's proof images, newest first: WHERE seller_id = ? ORDER BY created_at DESC, id DESC
+        # (+ id for the cursor)
+        Index("ix_seller_proof_seller_created", "seller_id", text("created_at DESC"), text("id DESC")),
+    )
+    
     def __repr__(self):
         return f"<SellerProof(id={self.id}, seller_id={self.seller_id})>"
\ No newline at end of file
@@ -8,13 +8,13 @@ Database table: users
 Columns: id, username, email, password_hash, is_verified, created_at, updated_at
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey 
+from sqlalchemy import Column, Integer, Float, String, Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship 
-from datetime import datetime
-from models import Base
+from models import Base, utc_now
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     # Primary Key - Unique ID for each user
     id = Column(Integer, primary_key=True, index=True)
@@ -28,24 +28,32 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     
     # Relationships (links to other tables)
     profile = relationship("UserProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
     listings = relationship("Listing", back_populates="seller", cascade="all, delete-orphan")
-    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender")
-    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver")
-    reviews_given = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer")
-    reviews_received = relationship("Review", foreign_keys="Review.reviewed_user_id", back_populates="reviewed_user")
+    # lazy="raise": these can be huge, so touching them without an explicit
+    # query/loader option is a bug (an N+1) — fail loudly instead
+    sent_messages = relationship("Message", foreign_keys="Message.sender_id", back_populates="sender", lazy="raise")
+    received_messages = relationship("Message", foreign_keys="Message.receiver_id", back_populates="receiver", lazy="raise")
+    reviews_given = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer", lazy="raise")
+    reviews_received = relationship("Review", foreign_keys="Review.reviewed_user_id", back_populates="reviewed_user", lazy="raise")
     proof_images = relationship("SellerProof", back_populates="seller", cascade="all, delete-orphan")
     
+    # Case-insensitive email lookup for login (also stops Alice@x / alice@x duplicates)
+    __table_args__ = (
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
 
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
+    __mapper_args__ = {"eager_defaults": True}  # Load DB-set timestamps via RETURNING
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -59,11 +67,14 @@ class UserProfile(Base):
     # Seller stats
     total_sales = Column(Integer, default=0)
     is_verified_seller = Column(Boolean, default=False)
-    average_rating = Column(Integer, default=0)  # Will calculate from reviews
+    average_rating = Column(Float, default=0.0)
+    # Running totals so a new review is an O(1) update, not an AVG over all reviews
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     
     # Relationship back to User
     user = relationship("User", back_populates="profile")
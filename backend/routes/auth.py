@@ -26,30 +26,29 @@ HOW JWT TOKENS WORK:
 7. Token expires after 30 minutes for security
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import create_engine, select
-from pydantic import BaseModel, EmailStr
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from typing import Optional
+import jwt
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import re
 import secrets
+import time
 
 # Import models and config
 from models import Base, User, UserProfile
-from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, DATABASE_URL
-
-# Create engine and SessionLocal (same as in app.py)
-engine = create_engine(DATABASE_URL, echo=False, future=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-def get_db():
-    """Get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, BCRYPT_ROUNDS, BCRYPT_WORKERS
+from db import get_db
+from utils.auth_cache import AuthCache
+from utils.redis_cache import get_redis, cache_get, cache_set
 
 # ============================================================================
 # SECURITY SETUP
@@ -57,7 +56,20 @@ def get_db():
 
 # Password hashing context
 # This uses bcrypt to securely hash passwords
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# BCRYPT_ROUNDS defaults to 12; drop it to 4 in dev for fast logins
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# Thread pool for bcrypt
+# bcrypt (pyca/bcrypt >= 4) releases the GIL while it hashes, so threads run
+# in parallel — no extra processes, pickling or IPC needed.
+# Kept small on purpose: there is already one Uvicorn worker per core, so a
+# few hashing threads per worker is enough to use the CPUs.
+_bcrypt_pool = ThreadPoolExecutor(max_workers=BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+
+# JWT signing key
+# PyJWT uses the C HMAC from OpenSSL; encoding the key once saves doing it per request
+SECRET_KEY_BYTES = SECRET_KEY.encode()
+JWTError = jwt.PyJWTError
 
 # Create router
 # This groups all auth endpoints together under /api/auth
@@ -69,33 +81,46 @@ router = APIRouter()
 # These define what data the API expects and returns
 # Think of them as contracts: "If you send this, you get that back"
 
+# Cheap "looks like an email" check for login (compiled once at import).
+# Signup still uses EmailStr — login only needs a usable lookup key.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
 class UserSignupRequest(BaseModel):
     """What the user sends when signing up"""
     username: str  # e.g., "alice123"
     email: EmailStr  # Validated email format
     password: str  # At least 8 characters (you should add validation)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "username": "alice123",
                 "email": "alice@example.com",
                 "password": "securepass123"
             }
         }
+    )
 
 class UserLoginRequest(BaseModel):
     """What the user sends when logging in"""
-    email: EmailStr
+    email: str
     password: str
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("email")
+    @classmethod
+    def check_email(cls, v: str) -> str:
+        if not _EMAIL_RE.fullmatch(v):
+            raise ValueError("Invalid email address")
+        return v.lower()
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "email": "alice@example.com",
                 "password": "securepass123"
             }
         }
+    )
 
 class UserResponse(BaseModel):
     """What we send back to the user (never include password!)"""
@@ -105,8 +130,7 @@ class UserResponse(BaseModel):
     is_verified: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True  # Read from SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True)  # Read from SQLAlchemy models
 
 class TokenResponse(BaseModel):
     """What we send back after successful login"""
@@ -122,7 +146,15 @@ class VerificationEmailRequest(BaseModel):
 # HELPER FUNCTIONS
 # ============================================================================
 
-def hash_password(password: str) -> str:
+def _bcrypt_hash(password: str) -> str:
+    """Runs on a _bcrypt_pool thread"""
+    return pwd_context.hash(password)
+
+def _bcrypt_verify(plain_password: str, hashed_password: str) -> bool:
+    """Runs on a _bcrypt_pool thread"""
+    return pwd_context.verify(plain_password, hashed_password)
+
+async def hash_password(password: str) -> str:
     """
     Hash a plain text password using bcrypt.
     
@@ -130,10 +162,12 @@ def hash_password(password: str) -> str:
     can't immediately use those passwords.
     
     bcrypt is slow on purpose — makes brute force attacks harder.
+    Because it's slow, it runs on the bcrypt thread pool so it doesn't block the event loop.
     """
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, _bcrypt_hash, password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify that a plain password matches the hashed version.
     
@@ -142,7 +176,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     2. We get hashed password from database
     3. We check if they match (without ever storing the plain password)
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, _bcrypt_verify, plain_password, hashed_password)
 
 def create_access_token(user_id: int, expires_delta: timedelta = None) -> str:
     """
@@ -153,19 +188,17 @@ def create_access_token(user_id: int, expires_delta: timedelta = None) -> str:
     
     The token is SIGNED with SECRET_KEY, so we can verify nobody tampered with it.
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     # Payload = the data inside the token
     payload = {
         "user_id": user_id,
-        "exp": expire  # Expiration time
+        "exp": int(time.time() + expires_delta.total_seconds())  # Expiration time (Unix seconds)
     }
     
     # Encode = create the token
-    encoded_jwt = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(payload, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 def generate_email_verification_token() -> str:
@@ -181,50 +214,149 @@ def generate_email_verification_token() -> str:
     """
     return secrets.token_urlsafe(32)
 
+# Unique constraints on users, by name: create_all builds the ix_* indexes,
+# database/schema.sql the *_key constraints
+_USERNAME_CONSTRAINTS = {"ix_users_username", "users_username_key"}
+_EMAIL_CONSTRAINTS = {"ix_users_email", "users_email_key", "ix_users_email_lower"}
+
+def _duplicate_field(error: IntegrityError) -> Optional[str]:
+    """
+    Work out which unique column a failed users INSERT tripped over.
+    
+    Uses the violated constraint's name (asyncpg puts it on the original
+    exception, error.orig.__cause__) rather than the error text, which
+    changes with the server's lc_messages. Returns None for anything else.
+    """
+    constraint = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint in _USERNAME_CONSTRAINTS:
+        return "username"
+    if constraint in _EMAIL_CONSTRAINTS:
+        return "email"
+    return None
+
 # ============================================================================
 # DEPENDENCY: Get current user from token
 # ============================================================================
 
-async def get_current_user(authorization: str = Header(None), db: Session = Depends(get_db)):
+def _extract_bearer_token(authorization: str):
+    """
+    Pull the token out of an "Authorization: Bearer <token>" header.
+    Returns None if the header is missing or malformed.
+    """
+    if not authorization:
+        return None
+    try:
+        scheme, token = authorization.split()
+    except ValueError:
+        return None
+    if scheme.lower() != "bearer":
+        return None
+    return token
+
+def _decode_token(token: str, cache: AuthCache):
+    """
+    Decode a JWT and return its user_id (or None if invalid/expired).
+    
+    Results are cached per token, so a client reusing the same token
+    only pays for the signature check once a minute.
+    """
+    cached = cache.tokens.get(token)
+    if cached is not None:
+        user_id, exp = cached
+        # The cache can outlive the token, so re-check expiry
+        if exp > time.time():
+            return user_id
+        cache.tokens.pop(token, None)
+        return None
+    
+    try:
+        # Tokens without exp/user_id are rejected here (-> 401), so a token
+        # can never be cached without an expiry
+        payload = jwt.decode(
+            token, SECRET_KEY_BYTES, algorithms=[ALGORITHM],
+            options={"require": ["exp", "user_id"]},
+        )
+    except JWTError:
+        return None
+    
+    user_id = payload["user_id"]
+    cache.tokens[token] = (user_id, payload["exp"])
+    return user_id
+
+# Shared user cache (Redis), the tier between this worker's AuthCache and Postgres
+# Only the columns routes read off current_user are stored — never the password hash.
+# (Profile data lives in user_profiles, so profile edits don't make this stale.)
+USER_CACHE_TTL = 60
+_USER_CACHE_FIELDS = ("id", "username", "email", "is_verified", "created_at")
+
+def _user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+def _user_from_cache(data: bytes) -> User:
+    """Rebuild a (detached, read-only) User from its cached JSON"""
+    fields = orjson.loads(data)
+    fields["created_at"] = datetime.fromisoformat(fields["created_at"])
+    return User(**fields)
+
+async def get_current_user(
+    request: Request,
+    authorization: str = Header(None),
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
+):
     """
     Dependency that extracts user from JWT token in Authorization header.
     
     Header format: Authorization: Bearer <token>
+    
+    Where the user comes from (first hit wins):
+    1. request.state.user — already resolved earlier in this request
+    2. app.state.auth_cache — this worker's in-memory cache
+    3. Redis (user:{id}) — shared by all workers
+    4. Postgres
     """
+    # Already resolved for this request (e.g. by another dependency)
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return user
+    
+    cache: AuthCache = request.app.state.auth_cache
+    
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    if not authorization:
-        raise credentials_exception
-    
     # Extract token from "Bearer <token>"
-    try:
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise credentials_exception
-    except ValueError:
+    token = _extract_bearer_token(authorization)
+    if token is None:
         raise credentials_exception
     
-    try:
-        # Decode the token
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("user_id")
-        
-        if user_id is None:
-            raise credentials_exception
-            
-    except JWTError:
+    # Decode the token (cached)
+    user_id = _decode_token(token, cache)
+    if user_id is None:
         raise credentials_exception
     
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
-    
+    # Get user (from a cache, or from database)
+    user = cache.users.get(user_id)
     if user is None:
-        raise credentials_exception
+        cached = await cache_get(r, _user_key(user_id))
+        if cached is not None:
+            user = _user_from_cache(cached)
+        else:
+            # Primary-key lookup: checks the session's identity map first
+            user = await db.get(User, user_id)
+            
+            if user is None:
+                raise credentials_exception
+            
+            snapshot = {field: getattr(user, field) for field in _USER_CACHE_FIELDS}
+            await cache_set(r, _user_key(user_id), orjson.dumps(snapshot), USER_CACHE_TTL)
+        
+        cache.users[user_id] = user
     
+    request.state.user = user
     return user
 
 # ============================================================================
@@ -232,57 +364,52 @@ async def get_current_user(authorization: str = Header(None), db: Session = Depe
 # ============================================================================
 
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def signup(request: UserSignupRequest, db: Session = Depends(get_db)):
+async def signup(request: UserSignupRequest, db: AsyncSession = Depends(get_db)):
     """
     Register a new user account.
     
     Flow:
-    1. Check if username/email already exists
-    2. Hash password
-    3. Create user in database
-    4. Create user profile
-    5. Generate verification token (for email verification)
-    6. Create JWT token (for immediate login)
-    7. Return token + user info
+    1. Hash password
+    2. Create user + user profile in database (one commit)
+    3. If username/email already exists, the INSERT fails -> 400
+    4. Generate verification token (for email verification)
+    5. Create JWT token (for immediate login)
+    6. Return token + user info
     
     TODO: Send verification email with token
     """
     
-    # Check if username exists
-    existing_user = db.query(User).filter(User.username == request.username).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already taken"
-        )
-    
-    # Check if email exists
-    existing_email = db.query(User).filter(User.email == request.email).first()
-    if existing_email:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-    
     # Hash password (NEVER store plain passwords!)
-    hashed_password = hash_password(request.password)
+    hashed_password = await hash_password(request.password)
     
-    # Create user
+    # Create user + profile
     new_user = User(
         username=request.username,
         email=request.email,
         password_hash=hashed_password,
         is_verified=False  # User must verify email
     )
+    new_user.profile = UserProfile()  # user_id is filled in on flush
     
+    # One transaction inserts both rows (and fetches the generated ID)
+    # No "does it exist?" SELECT first: the UNIQUE constraints on username
+    # and email reject duplicates, even when two signups race each other
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)  # Get the ID that was auto-generated
-    
-    # Create user profile
-    user_profile = UserProfile(user_id=new_user.id)
-    db.add(user_profile)
-    db.commit()
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        field = _duplicate_field(e)
+        if field is None:
+            raise  # Not a duplicate username/email — a real error
+        if field == "username":
+            detail = "Username already taken"
+        else:
+            detail = "Email already registered"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
     
     # TODO: Generate verification token and send email
     # verification_token = generate_email_verification_token()
@@ -295,11 +422,11 @@ def signup(request: UserSignupRequest, db: Session = Depends(get_db)):
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse.from_orm(new_user)
+        user=UserResponse.model_validate(new_user)
     )
 
 @router.post("/login", response_model=TokenResponse)
-def login(request: UserLoginRequest, db: Session = Depends(get_db)):
+async def login(request: UserLoginRequest, db: AsyncSession = Depends(get_db)):
     """
     Login and get access token.
     
@@ -313,12 +440,12 @@ def login(request: UserLoginRequest, db: Session = Depends(get_db)):
     Authorization: Bearer <token>
     """
     
-    # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
+    # Find user by email (case-insensitive, served by ix_users_email_lower)
+    user = await db.scalar(select(User).where(func.lower(User.email) == request.email))
     
     # If user doesn't exist or password is wrong, don't tell which one
     # (security: don't reveal whether email is registered)
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or not await verify_password(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -331,11 +458,11 @@ def login(request: UserLoginRequest, db: Session = Depends(get_db)):
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        user=UserResponse.from_orm(user)
+        user=UserResponse.model_validate(user)
     )
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(request: Request, current_user: User = Depends(get_current_user)):
     """
     Get current logged-in user's info.
     
@@ -347,11 +474,20 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
     Returns: Current user info
     
     This endpoint is PROTECTED — only works if you have a valid token.
+    
+    The encoded JSON body is cached per user, so repeat calls just send bytes.
     """
-    return UserResponse.from_orm(current_user)
+    cache: AuthCache = request.app.state.auth_cache
+    
+    body = cache.me.get(current_user.id)
+    if body is None:
+        body = ORJSONResponse(UserResponse.model_validate(current_user).model_dump()).body
+        cache.me[current_user.id] = body
+    
+    return Response(content=body, media_type="application/json")
 
 @router.post("/logout")
-def logout():
+async def logout(request: Request, authorization: str = Header(None)):
     """
     Logout endpoint.
     
@@ -359,8 +495,13 @@ def logout():
     - Client just deletes the token from localStorage
     - Token expires automatically after 30 minutes
     
-    This endpoint exists for API completeness.
+    We also drop the token from the decode cache here. (This is not a
+    revocation — the token itself stays valid until it expires.)
     """
+    token = _extract_bearer_token(authorization)
+    if token is not None:
+        request.app.state.auth_cache.tokens.pop(token, None)
+    
     return {"message": "Successfully logged out"}
 
 # ============================================================================
@@ -369,7 +510,7 @@ def logout():
 # These are automatically used by FastAPI when errors occur
 
 @router.get("/token")
-def get_token_info(current_user: User = Depends(get_current_user)):
+async def get_token_info(current_user: User = Depends(get_current_user)):
     """
     Debug endpoint to verify current token.
     Only works if token is valid.
@@ -20,35 +20,58 @@ FILTERS:
 - verified_seller_only — Only show verified sellers
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy import select, update, bindparam, exists, tuple_
+from pydantic import BaseModel, ConfigDict, Field, AliasPath, field_validator
 from datetime import datetime, date
 from typing import Optional, List
+from urllib.parse import urlencode
+import orjson
 
 # Import models and dependencies
 from models import User, Listing, UserProfile
-from routes.auth import get_db, get_current_user
+from db import get_db
+from routes.auth import get_current_user
+from utils.redis_cache import get_redis, cache_get, cache_set, cache_delete
+from utils.search import contains_pattern
 
 # ============================================================================
 # PYDANTIC SCHEMAS
 # ============================================================================
 
+# Prices are stored as whole cents in an INTEGER column (max 2,147,483,647),
+# so the API accepts $0.01 up to the largest amount that still fits.
+MIN_PRICE = 0.01
+MAX_PRICE = 21_474_836.47
+
 class ListingCreateRequest(BaseModel):
-    """Data to create a new listing"""
+    """
+    Data to create a new listing
+    
+    Validation happens here, while the body is parsed — a bad request gets a
+    422 before the endpoint runs (the limits also show up in /docs).
+    """
     artist_name: str
     concert_date: date
     venue_name: str
     section: Optional[str] = None
     row: Optional[str] = None
     seat_number: Optional[str] = None
-    price: float  # Price in dollars
-    quantity_available: int = 1
+    price: float = Field(ge=MIN_PRICE, le=MAX_PRICE)  # Price in dollars
+    quantity_available: int = Field(default=1, gt=0)
     description: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("concert_date")
+    @classmethod
+    def check_future_date(cls, v: date) -> date:
+        if v <= date.today():
+            raise ValueError("Concert date must be in the future")
+        return v
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "artist_name": "Taylor Swift",
                 "concert_date": "2024-12-15",
@@ -61,24 +84,24 @@ class ListingCreateRequest(BaseModel):
                 "description": "Great view of the stage!"
             }
         }
+    )
 
 class ListingUpdateRequest(BaseModel):
     """Data to update a listing"""
-    price: Optional[float] = None
-    quantity_available: Optional[int] = None
+    price: Optional[float] = Field(default=None, ge=MIN_PRICE, le=MAX_PRICE)
+    quantity_available: Optional[int] = Field(default=None, ge=0)
     description: Optional[str] = None
     is_available: Optional[bool] = None
 
 class SellerInfo(BaseModel):
-    """Seller info shown on listing"""
+    """Seller info shown on listing (stats come from seller.profile)"""
     id: int
     username: str
-    total_sales: int
-    average_rating: float
-    is_verified_seller: bool
+    total_sales: int = Field(validation_alias=AliasPath("profile", "total_sales"))
+    average_rating: float = Field(validation_alias=AliasPath("profile", "average_rating"))
+    is_verified_seller: bool = Field(validation_alias=AliasPath("profile", "is_verified_seller"))
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ListingResponse(BaseModel):
     """Full listing with seller info"""
@@ -89,7 +112,8 @@ class ListingResponse(BaseModel):
     section: Optional[str]
     row: Optional[str]
     seat_number: Optional[str]
-    price: float
+    price: float  # Dollars (derived from price_cents)
+    price_cents: int
     quantity_available: int
     description: Optional[str]
     is_available: bool
@@ -97,8 +121,16 @@ class ListingResponse(BaseModel):
     updated_at: datetime
     seller: SellerInfo  # Nested seller info
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+class ListingSummary(BaseModel):
+    """Compact listing for the browse page (full details: GET /api/listings/{id})"""
+    id: int
+    artist_name: str
+    concert_date: date
+    venue_name: str
+    price: float  # Dollars
+    seller_username: str
 
 # ============================================================================
 # ROUTER
@@ -106,15 +138,130 @@ class ListingResponse(BaseModel):
 
 router = APIRouter()
 
+# Load each listing's seller + seller profile in the SAME query (LEFT OUTER
+# JOIN users / user_profiles) instead of one SELECT per listing.
+# raiseload("*") turns any other lazy load into an error, so a new N+1
+# shows up straight away instead of silently slowing the endpoint down.
+_with_seller = (joinedload(Listing.seller).joinedload(User.profile), raiseload("*"))
+
+def _to_cents(price: float) -> int:
+    """Convert a dollar amount from the API (150.5) to stored cents (15050)"""
+    return round(price * 100)
+
+# Redis cache (see utils/redis_cache.py)
+# Browse pages change whenever anything is listed/sold, so they expire fast;
+# a single listing is invalidated explicitly on update/delete.
+LISTINGS_CACHE_TTL = 60
+LISTING_CACHE_TTL = 300
+
+def _listing_key(listing_id: int) -> str:
+    return f"listing:{listing_id}"
+
+def _listings_key(**filters) -> str:
+    """
+    Cache key built from the handler's validated filters, not the raw query
+    string — unknown params (?x=1) can't mint new keys, and equal values
+    (min_price=10 vs 10.0) share one. Unset filters are left out; sorted so
+    the key is stable across workers.
+    """
+    return "listings:" + urlencode(sorted((k, v) for k, v in filters.items() if v is not None))
+
+async def _invalidate_listings(r, listing_id: Optional[int] = None):
+    """Drop every cached browse page (and the single listing, if given)"""
+    keys = (_listing_key(listing_id),) if listing_id is not None else ()
+    await cache_delete(r, *keys, pattern="listings:*")
+
+async def invalidate_seller_listings(r, db: AsyncSession, seller_id: int):
+    """
+    Drop the cached GET /{id} bodies of every listing by this seller.
+    
+    They embed the seller's average_rating / is_verified_seller, so call this
+    when those change (e.g. after a new review in routes/users.py).
+    Browse pages only carry the seller's username and are left alone.
+    """
+    if r is None:
+        return
+    listing_ids = (await db.scalars(select(Listing.id).where(Listing.seller_id == seller_id))).all()
+    if listing_ids:
+        await cache_delete(r, *(_listing_key(listing_id) for listing_id in listing_ids))
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+# Flat projections (no ORM objects)
+# Selecting plain columns (listing + seller + profile in one JOIN) and building
+# dicts directly skips ORM object creation AND per-field Pydantic validation —
+# the data comes straight from our own database, so there's nothing to validate.
+# _listing_row_select matches ListingResponse; _summary_select matches ListingSummary.
+_listing_row_select = (
+    select(
+        Listing.id, Listing.artist_name, Listing.concert_date, Listing.venue_name,
+        Listing.section, Listing.row, Listing.seat_number, Listing.price_cents,
+        Listing.quantity_available, Listing.description, Listing.is_available,
+        Listing.created_at, Listing.updated_at,
+        User.id.label("seller_id"), User.username,
+        UserProfile.total_sales, UserProfile.average_rating, UserProfile.is_verified_seller,
+    )
+    .join(User, User.id == Listing.seller_id)
+    .join(UserProfile, UserProfile.user_id == User.id)
+)
+
+# Browse page: only the columns ListingSummary needs
+_summary_select = (
+    select(
+        Listing.id, Listing.artist_name, Listing.concert_date, Listing.venue_name,
+        Listing.price_cents, User.username,
+    )
+    .join(User, User.id == Listing.seller_id)
+)
+
+def _summary_row_to_dict(row) -> dict:
+    """One result row -> the ListingSummary JSON shape"""
+    return {
+        "id": row.id,
+        "artist_name": row.artist_name,
+        "concert_date": row.concert_date,
+        "venue_name": row.venue_name,
+        "price": row.price_cents / 100,
+        "seller_username": row.username,
+    }
+
+def _listing_row_to_dict(row) -> dict:
+    """One result row -> the ListingResponse JSON shape"""
+    return {
+        "id": row.id,
+        "artist_name": row.artist_name,
+        "concert_date": row.concert_date,
+        "venue_name": row.venue_name,
+        "section": row.section,
+        "row": row.row,
+        "seat_number": row.seat_number,
+        "price": row.price_cents / 100,
+        "price_cents": row.price_cents,
+        "quantity_available": row.quantity_available,
+        "description": row.description,
+        "is_available": row.is_available,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "seller": {
+            "id": row.seller_id,
+            "username": row.username,
+            "total_sales": row.total_sales,
+            "average_rating": float(row.average_rating),
+            "is_verified_seller": row.is_verified_seller,
+        },
+    }
+
 # ============================================================================
 # CREATE LISTING
 # ============================================================================
 
 @router.post("/", response_model=ListingResponse, status_code=status.HTTP_201_CREATED)
-def create_listing(
+async def create_listing(
     request: ListingCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Create a new ticket listing.
@@ -122,34 +269,13 @@ def create_listing(
     REQUIRES: Valid JWT token (user must be logged in)
     
     Flow:
-    1. Validate concert date is in the future
-    2. Create listing in database
-    3. Return listing details with seller info
+    1. Create listing in database (the date/price/quantity checks already
+       ran in ListingCreateRequest)
+    2. Return listing details with seller info
     
     Only logged-in users can create listings.
     """
     
-    # Validate concert date is in future
-    if request.concert_date <= date.today():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Concert date must be in the future"
-        )
-    
-    # Validate price is positive
-    if request.price <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Price must be greater than 0"
-        )
-    
-    # Validate quantity is positive
-    if request.quantity_available <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Quantity must be at least 1"
-        )
-    
     # Create listing
     new_listing = Listing(
         seller_id=current_user.id,
@@ -159,40 +285,50 @@ def create_listing(
         section=request.section,
         row=request.row,
         seat_number=request.seat_number,
-        price=request.price,
+        price_cents=_to_cents(request.price),
         quantity_available=request.quantity_available,
         description=request.description,
         is_available=True
     )
     
     db.add(new_listing)
-    db.commit()
-    db.refresh(new_listing)
+    await db.commit()
     
-    return new_listing
+    await _invalidate_listings(r)
+    
+    # Load seller + profile for the response (lazy loading isn't allowed
+    # with AsyncSession — it would need an await on attribute access)
+    return await db.scalar(
+        select(Listing).options(*_with_seller).where(Listing.id == new_listing.id)
+    )
 
 # ============================================================================
 # GET ALL LISTINGS (with filters)
 # ============================================================================
 
-@router.get("/", response_model=List[ListingResponse])
-def get_listings(
+@router.get("/", response_model=List[ListingSummary])
+async def get_listings(
     artist_name: Optional[str] = Query(None, description="Search by artist name"),
-    min_price: Optional[float] = Query(None, ge=0, description="Minimum price"),
-    max_price: Optional[float] = Query(None, ge=0, description="Maximum price"),
+    min_price: Optional[float] = Query(None, ge=0, le=MAX_PRICE, description="Minimum price"),
+    max_price: Optional[float] = Query(None, ge=0, le=MAX_PRICE, description="Maximum price"),
     venue_name: Optional[str] = Query(None, description="Search by venue"),
     section: Optional[str] = Query(None, description="Filter by section"),
     concert_date_from: Optional[date] = Query(None, description="Concert date from"),
     concert_date_to: Optional[date] = Query(None, description="Concert date to"),
     verified_seller_only: bool = Query(False, description="Only show verified sellers"),
     is_available: bool = Query(True, description="Only show available listings"),
-    skip: int = Query(0, ge=0, description="Skip N listings (for pagination)"),
+    after_date: Optional[date] = Query(None, description="Cursor: concert_date of the last listing you got"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last listing you got"),
     limit: int = Query(10, ge=1, le=100, description="Return max N listings"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Get all ticket listings with optional filters.
     
+    Returns ListingSummary rows (no description / seller stats) to keep
+    pages small — fetch GET /api/listings/{id} for the full listing.
+    
     FILTERS:
     - artist_name: Search by artist (case-insensitive partial match)
     - min_price / max_price: Price range
@@ -202,72 +338,121 @@ def get_listings(
     - verified_seller_only: Only show verified sellers
     - is_available: Only available listings
     
-    PAGINATION:
-    - skip: How many to skip (for loading more)
+    PAGINATION (keyset / cursor):
     - limit: How many to return (max 100)
+    - after_date + after_id: the concert_date and id of the LAST listing on
+      the previous page; leave both out for the first page
+    
+    Unlike OFFSET, the database jumps straight to the cursor in the index,
+    so page 500 is as fast as page 1.
     
     Example:
     GET /api/listings?artist_name=Taylor&min_price=100&max_price=200
+    
+    Pages are cached in Redis for LISTINGS_CACHE_TTL seconds (keyed by the filters).
     """
     
-    # Start with base query
-    query = db.query(Listing)
+    if (after_date is None) != (after_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="after_date and after_id must be used together"
+        )
+    
+    cache_key = _listings_key(
+        artist_name=artist_name or None,  # Empty string = no filter
+        venue_name=venue_name or None,
+        section=section or None,
+        min_cents=_to_cents(min_price) if min_price is not None else None,
+        max_cents=_to_cents(max_price) if max_price is not None else None,
+        concert_date_from=concert_date_from,
+        concert_date_to=concert_date_to,
+        verified_seller_only=verified_seller_only,
+        is_available=is_available,
+        after_date=after_date,
+        after_id=after_id,
+        limit=limit,
+    )
+    cached = await cache_get(r, cache_key)
+    if cached is not None:
+        return _json_response(cached)
+    
+    # Start with base query (users is already joined for the username)
+    query = _summary_select
+    
+    # Values for named bind parameters, passed in at execute time.
+    # The statement itself only depends on WHICH filters are used, so
+    # SQLAlchemy's compiled-SQL cache gets a hit for every repeat shape.
+    params = {}
     
     # Filter by availability
-    query = query.filter(Listing.is_available == is_available)
+    query = query.where(Listing.is_available == is_available)
     
     # Filter by artist name (case-insensitive contains)
+    # With pg_trgm installed, ix_listings_artist_trgm / ix_listings_venue_trgm
+    # (database/migrations/002) serve these ILIKE '%...%' lookups
     if artist_name:
-        query = query.filter(Listing.artist_name.ilike(f"%{artist_name}%"))
+        query = query.where(Listing.artist_name.ilike(bindparam("artist_pattern"), escape="\\"))
+        params["artist_pattern"] = contains_pattern(artist_name)
     
     # Filter by venue (case-insensitive contains)
     if venue_name:
-        query = query.filter(Listing.venue_name.ilike(f"%{venue_name}%"))
+        query = query.where(Listing.venue_name.ilike(bindparam("venue_pattern"), escape="\\"))
+        params["venue_pattern"] = contains_pattern(venue_name)
     
     # Filter by section
     if section:
-        query = query.filter(Listing.section == section)
+        query = query.where(Listing.section == section)
     
     # Filter by price range
     if min_price is not None:
-        query = query.filter(Listing.price >= min_price)
+        query = query.where(Listing.price_cents >= _to_cents(min_price))
     if max_price is not None:
-        query = query.filter(Listing.price <= max_price)
-    
-    # Filter by concert date range
-    if concert_date_from:
-        query = query.filter(Listing.concert_date >= concert_date_from)
-    if concert_date_to:
-        query = query.filter(Listing.concert_date <= concert_date_to)
+        query = query.where(Listing.price_cents <= _to_cents(max_price))
     
     # Filter by verified seller only
     if verified_seller_only:
-        query = query.join(User).join(UserProfile).filter(
+        query = query.join(UserProfile, UserProfile.user_id == Listing.seller_id).where(
             UserProfile.is_verified_seller == True
         )
     
-    # Sort by date (oldest first)
-    query = query.order_by(Listing.concert_date.asc())
+    # Filter by concert date range
+    if concert_date_from:
+        query = query.where(Listing.concert_date >= concert_date_from)
+    if concert_date_to:
+        query = query.where(Listing.concert_date <= concert_date_to)
+    
+    # Keyset pagination: everything after the cursor, in the same order
+    if after_date is not None:
+        query = query.where(tuple_(Listing.concert_date, Listing.id) > tuple_(after_date, after_id))
     
-    # Pagination
-    total = query.count()
-    listings = query.offset(skip).limit(limit).all()
+    # Sort by date (oldest first); id breaks ties so the cursor is exact
+    query = query.order_by(Listing.concert_date.asc(), Listing.id.asc())
     
-    return listings
+    # No COUNT(*) and no OFFSET — just the next `limit` rows
+    rows = (await db.execute(query.limit(limit), params)).all()
+    
+    body = orjson.dumps([_summary_row_to_dict(row) for row in rows])
+    await cache_set(r, cache_key, body, LISTINGS_CACHE_TTL)
+    
+    return _json_response(body)
 
 # ============================================================================
 # GET SINGLE LISTING
 # ============================================================================
 
 @router.get("/{listing_id}", response_model=ListingResponse)
-def get_listing(listing_id: int, db: Session = Depends(get_db)):
+async def get_listing(listing_id: int, db: AsyncSession = Depends(get_db), r = Depends(get_redis)):
     """
     Get details of a single listing.
     
-    Returns listing with seller information.
+    Returns listing with seller information (cached in Redis).
     """
     
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
+    cached = await cache_get(r, _listing_key(listing_id))
+    if cached is not None:
+        return _json_response(cached)
+    
+    listing = await db.scalar(select(Listing).options(*_with_seller).where(Listing.id == listing_id))
     
     if not listing:
         raise HTTPException(
@@ -275,18 +460,22 @@ def get_listing(listing_id: int, db: Session = Depends(get_db)):
             detail=f"Listing {listing_id} not found"
         )
     
-    return listing
+    body = orjson.dumps(ListingResponse.model_validate(listing).model_dump())
+    await cache_set(r, _listing_key(listing_id), body, LISTING_CACHE_TTL)
+    
+    return _json_response(body)
 
 # ============================================================================
 # UPDATE LISTING
 # ============================================================================
 
 @router.put("/{listing_id}", response_model=ListingResponse)
-def update_listing(
+async def update_listing(
     listing_id: int,
     request: ListingUpdateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Update a listing (only seller can update their own listing).
@@ -298,61 +487,70 @@ def update_listing(
     - is_available (mark as sold/unavailable)
     """
     
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
-    
-    if not listing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Listing not found"
-        )
-    
-    # Check if current user is the seller
-    if listing.seller_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only update your own listings"
-        )
-    
     # Update fields if provided
+    # (price range and quantity >= 0 are checked by ListingUpdateRequest)
+    values = {}
     if request.price is not None:
-        if request.price <= 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Price must be greater than 0"
-            )
-        listing.price = request.price
+        values["price_cents"] = _to_cents(request.price)
     
     if request.quantity_available is not None:
-        if request.quantity_available < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Quantity cannot be negative"
-            )
-        listing.quantity_available = request.quantity_available
+        values["quantity_available"] = request.quantity_available
     
     if request.description is not None:
-        listing.description = request.description
+        values["description"] = request.description
     
     if request.is_available is not None:
-        listing.is_available = request.is_available
+        values["is_available"] = request.is_available
+    
+    # ONE statement does the ownership check, the update and the response data:
+    #   WITH updated AS (UPDATE listings ... WHERE id = ? AND seller_id = me RETURNING *)
+    #   SELECT updated.*, seller + profile columns FROM updated JOIN users JOIN user_profiles
+    # (updated_at is set to UTC now() by the column's onupdate)
+    updated = (
+        update(Listing)
+        .where(Listing.id == listing_id, Listing.seller_id == current_user.id)
+        .values(**values)
+        .returning(*Listing.__table__.c)
+        .cte("updated")
+    )
+    row = (await db.execute(
+        select(
+            updated,
+            User.username,
+            UserProfile.total_sales, UserProfile.average_rating, UserProfile.is_verified_seller,
+        )
+        .join(User, User.id == updated.c.seller_id)
+        .join(UserProfile, UserProfile.user_id == updated.c.seller_id)
+    )).first()
     
-    # Update timestamp
-    listing.updated_at = datetime.utcnow()
+    if row is None:
+        # Nothing updated: either no such listing, or it isn't ours
+        if not await db.scalar(select(exists().where(Listing.id == listing_id))):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Listing not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only update your own listings"
+        )
     
-    db.commit()
-    db.refresh(listing)
+    await db.commit()
     
-    return listing
+    await _invalidate_listings(r, listing_id)
+    
+    return _json_response(orjson.dumps(_listing_row_to_dict(row)))
 
 # ============================================================================
 # DELETE LISTING
 # ============================================================================
 
 @router.delete("/{listing_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_listing(
+async def delete_listing(
     listing_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Delete a listing (only seller can delete).
@@ -360,7 +558,7 @@ def delete_listing(
     Returns 204 No Content on success.
     """
     
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
+    listing = await db.get(Listing, listing_id)
     
     if not listing:
         raise HTTPException(
@@ -375,8 +573,10 @@ def delete_listing(
             detail="You can only delete your own listings"
         )
     
-    db.delete(listing)
-    db.commit()
+    await db.delete(listing)
+    await db.commit()
+    
+    await _invalidate_listings(r, listing_id)
     
     return None
 
@@ -385,9 +585,9 @@ def delete_listing(
 # ============================================================================
 
 @router.get("/seller/{seller_id}", response_model=List[ListingResponse])
-def get_seller_listings(
+async def get_seller_listings(
     seller_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all listings by a specific seller.
@@ -395,17 +595,18 @@ def get_seller_listings(
     Useful for viewing a seller's profile and their tickets.
     """
     
-    # Check if seller exists
-    seller = db.query(User).filter(User.id == seller_id).first()
-    if not seller:
+    # Check if seller exists (SELECT EXISTS — just a boolean, no row)
+    if not await db.scalar(select(exists().where(User.id == seller_id))):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Seller not found"
         )
     
-    listings = db.query(Listing).filter(
-        Listing.seller_id == seller_id,
-        Listing.is_available == True
-    ).order_by(Listing.concert_date.asc()).all()
+    rows = (await db.execute(
+        _listing_row_select.where(
+            Listing.seller_id == seller_id,
+            Listing.is_available == True
+        ).order_by(Listing.concert_date.asc())
+    )).all()
     
-    return listings
\ No newline at end of file
+    return _json_response(orjson.dumps([_listing_row_to_dict(row) for row in rows]))
\ No newline at end of file
@@ -19,16 +19,19 @@ FEATURES:
 - See all messages you've sent/received
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import or_, and_, case, func, select, update, delete, exists, lambda_stmt
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional, List
+import orjson
 
 # Import models and dependencies
 from models import User, Message, Listing
-from routes.auth import get_db, get_current_user
+from db import get_db
+from routes.auth import get_current_user
+from utils.redis_cache import get_redis, cache_get, cache_set, cache_delete
 
 # ============================================================================
 # PYDANTIC SCHEMAS
@@ -40,14 +43,15 @@ class MessageCreateRequest(BaseModel):
     message_text: str  # The message content
     listing_id: Optional[int] = None  # Which listing is this about?
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "receiver_id": 5,
                 "message_text": "Is this ticket still available? Can we do $140?",
                 "listing_id": 12
             }
         }
+    )
 
 class MessageResponse(BaseModel):
     """Message data returned to user"""
@@ -59,16 +63,14 @@ class MessageResponse(BaseModel):
     is_read: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class MessageDetailResponse(MessageResponse):
     """Message with sender/receiver info"""
     sender: Optional[dict]  # Sender's username
     receiver: Optional[dict]  # Receiver's username
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ConversationResponse(BaseModel):
     """Summary of conversation with another user"""
@@ -78,8 +80,7 @@ class ConversationResponse(BaseModel):
     last_message_time: datetime
     unread_count: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # ============================================================================
 # ROUTER
@@ -87,15 +88,58 @@ class ConversationResponse(BaseModel):
 
 router = APIRouter()
 
+# Unread badge count is polled often; cache it briefly in Redis and drop it
+# whenever a message to that user is sent, read or deleted
+UNREAD_CACHE_TTL = 10
+
+def _unread_key(user_id: int) -> str:
+    return f"unread:{user_id}"
+
+# ============================================================================
+# DEPENDENCY: Load a message the current user may see
+# ============================================================================
+
+async def get_owned_message(
+    message_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Message:
+    """
+    Load a message by ID, or raise 404 / 403.
+    
+    Only the sender or receiver may access a message.
+    
+    lambda_stmt caches the statement itself (not just the compiled SQL), so
+    the select() isn't rebuilt on every call — message_id becomes a bind param.
+    FastAPI hands the same current_user and db session to the endpoint.
+    """
+    message = await db.scalar(lambda_stmt(lambda: select(Message).where(Message.id == message_id)))
+    
+    if not message:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Message not found"
+        )
+    
+    # Check if user is sender or receiver
+    if message.sender_id != current_user.id and message.receiver_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view your own messages"
+        )
+    
+    return message
+
 # ============================================================================
 # SEND MESSAGE
 # ============================================================================
 
 @router.post("/", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
-def send_message(
+async def send_message(
     request: MessageCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Send a direct message to another user.
@@ -118,9 +162,8 @@ def send_message(
             detail="Cannot send message to yourself"
         )
     
-    # Check if receiver exists
-    receiver = db.query(User).filter(User.id == request.receiver_id).first()
-    if not receiver:
+    # Check if receiver exists (SELECT EXISTS — just a boolean, no row)
+    if not await db.scalar(select(exists().where(User.id == request.receiver_id))):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Receiver not found"
@@ -128,8 +171,7 @@ def send_message(
     
     # If listing_id provided, verify it exists
     if request.listing_id:
-        listing = db.query(Listing).filter(Listing.id == request.listing_id).first()
-        if not listing:
+        if not await db.scalar(select(exists().where(Listing.id == request.listing_id))):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Listing not found"
@@ -152,8 +194,9 @@ def send_message(
     )
     
     db.add(new_message)
-    db.commit()
-    db.refresh(new_message)
+    await db.commit()  # id + created_at come back via RETURNING
+    
+    await cache_delete(r, _unread_key(request.receiver_id))
     
     return new_message
 
@@ -162,12 +205,12 @@ def send_message(
 # ============================================================================
 
 @router.get("/", response_model=List[MessageResponse])
-def get_all_messages(
+async def get_all_messages(
     unread_only: bool = Query(False, description="Only unread messages"),
     skip: int = Query(0, ge=0, description="Skip N messages"),
     limit: int = Query(20, ge=1, le=100, description="Return max N messages"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all messages for current user (sent or received).
@@ -183,7 +226,7 @@ def get_all_messages(
     """
     
     # Get messages where user is either sender or receiver
-    query = db.query(Message).filter(
+    query = select(Message).where(
         or_(
             Message.sender_id == current_user.id,
             Message.receiver_id == current_user.id
@@ -192,7 +235,7 @@ def get_all_messages(
     
     # Filter by unread
     if unread_only:
-        query = query.filter(
+        query = query.where(
             and_(
                 Message.receiver_id == current_user.id,
                 Message.is_read == False
@@ -200,7 +243,9 @@ def get_all_messages(
         )
     
     # Sort by newest first
-    messages = query.order_by(Message.created_at.desc()).offset(skip).limit(limit).all()
+    messages = (await db.scalars(
+        query.order_by(Message.created_at.desc()).offset(skip).limit(limit)
+    )).all()
     
     return messages
 
@@ -209,10 +254,11 @@ def get_all_messages(
 # ============================================================================
 
 @router.get("/conversation/{other_user_id}", response_model=List[MessageResponse])
-def get_conversation(
+async def get_conversation(
     other_user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Get all messages in a conversation with another user.
@@ -224,15 +270,29 @@ def get_conversation(
     """
     
     # Check if other user exists
-    other_user = db.query(User).filter(User.id == other_user_id).first()
+    other_user = await db.get(User, other_user_id)
     if not other_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
+    # Mark all messages received by current user as read
+    # One UPDATE ... WHERE is_read = false — no rows loaded into Python
+    await db.execute(
+        update(Message).where(
+            Message.sender_id == other_user_id,
+            Message.receiver_id == current_user.id,
+            Message.is_read == False
+        ).values(is_read=True).execution_options(synchronize_session=False)
+    )
+    
+    await db.commit()
+    await cache_delete(r, _unread_key(current_user.id))
+    
     # Get all messages between these two users
-    messages = db.query(Message).filter(
+    # (loaded AFTER the UPDATE, so they already show is_read = true)
+    messages = (await db.scalars(select(Message).where(
         or_(
             and_(
                 Message.sender_id == current_user.id,
@@ -243,21 +303,7 @@ def get_conversation(
                 Message.receiver_id == current_user.id
             )
         )
-    ).order_by(Message.created_at.asc()).all()
-    
-    # Mark all messages received by current user as read
-    unread_messages = db.query(Message).filter(
-        and_(
-            Message.sender_id == other_user_id,
-            Message.receiver_id == current_user.id,
-            Message.is_read == False
-        )
-    ).all()
-    
-    for msg in unread_messages:
-        msg.is_read = True
-    
-    db.commit()
+    ).order_by(Message.created_at.asc()))).all()
     
     return messages
 
@@ -266,38 +312,24 @@ def get_conversation(
 # ============================================================================
 
 @router.get("/{message_id}", response_model=MessageResponse)
-def get_message(
-    message_id: int,
+async def get_message(
+    message: Message = Depends(get_owned_message),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Get a single message by ID.
     
-    Only sender or receiver can view the message.
+    Only sender or receiver can view the message (checked by get_owned_message).
     Automatically marks as read if receiver.
     """
     
-    message = db.query(Message).filter(Message.id == message_id).first()
-    
-    if not message:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Message not found"
-        )
-    
-    # Check if user is sender or receiver
-    if message.sender_id != current_user.id and message.receiver_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view your own messages"
-        )
-    
     # Mark as read if receiver
     if message.receiver_id == current_user.id and not message.is_read:
         message.is_read = True
-        db.commit()
-        db.refresh(message)
+        await db.commit()
+        await cache_delete(r, _unread_key(current_user.id))
     
     return message
 
@@ -306,10 +338,11 @@ def get_message(
 # ============================================================================
 
 @router.put("/{message_id}/read", response_model=MessageResponse)
-def mark_as_read(
+async def mark_as_read(
     message_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Mark a message as read.
@@ -317,24 +350,29 @@ def mark_as_read(
     Only receiver can mark as read.
     """
     
-    message = db.query(Message).filter(Message.id == message_id).first()
+    # One UPDATE that also checks ownership; RETURNING gives us the row back
+    message = await db.scalar(
+        update(Message)
+        .where(Message.id == message_id, Message.receiver_id == current_user.id)
+        .values(is_read=True)
+        .returning(Message)
+    )
     
     if not message:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Message not found"
-        )
-    
-    # Check if user is receiver
-    if message.receiver_id != current_user.id:
+        # Nothing updated: either no such message, or it isn't ours
+        if not await db.scalar(select(exists().where(Message.id == message_id))):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Message not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only receiver can mark message as read"
         )
     
-    message.is_read = True
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    
+    await cache_delete(r, _unread_key(current_user.id))
     
     return message
 
@@ -343,10 +381,11 @@ def mark_as_read(
 # ============================================================================
 
 @router.delete("/{message_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_message(
+async def delete_message(
     message_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Delete a message.
@@ -354,23 +393,34 @@ def delete_message(
     Only sender or receiver can delete.
     """
     
-    message = db.query(Message).filter(Message.id == message_id).first()
-    
-    if not message:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Message not found"
+    # One DELETE that also checks ownership (no SELECT first)
+    receiver_id = await db.scalar(
+        delete(Message)
+        .where(
+            Message.id == message_id,
+            or_(
+                Message.sender_id == current_user.id,
+                Message.receiver_id == current_user.id
+            )
         )
+        .returning(Message.receiver_id)
+    )
     
-    # Check if user is sender or receiver
-    if message.sender_id != current_user.id and message.receiver_id != current_user.id:
+    if receiver_id is None:
+        # Nothing deleted: either no such message, or it isn't ours
+        if not await db.scalar(select(exists().where(Message.id == message_id))):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Message not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You can only delete your own messages"
         )
     
-    db.delete(message)
-    db.commit()
+    await db.commit()
+    
+    await cache_delete(r, _unread_key(receiver_id))
     
     return None
 
@@ -379,33 +429,41 @@ def delete_message(
 # ============================================================================
 
 @router.get("/stats/unread-count", response_model=dict)
-def get_unread_count(
+async def get_unread_count(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Get count of unread messages for current user.
     
-    Useful for showing notification badge.
+    Useful for showing notification badge. Cached for UNREAD_CACHE_TTL seconds.
     """
     
-    unread_count = db.query(Message).filter(
-        and_(
+    cached = await cache_get(r, _unread_key(current_user.id))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    unread_count = await db.scalar(
+        select(func.count()).select_from(Message).where(
             Message.receiver_id == current_user.id,
             Message.is_read == False
         )
-    ).count()
+    )
+    
+    body = orjson.dumps({"unread_count": unread_count})
+    await cache_set(r, _unread_key(current_user.id), body, UNREAD_CACHE_TTL)
     
-    return {"unread_count": unread_count}
+    return Response(content=body, media_type="application/json")
 
 # ============================================================================
 # GET CONVERSATIONS LIST
 # ============================================================================
 
 @router.get("/conversations/list", response_model=List[dict])
-def get_conversations_list(
+async def get_conversations_list(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get list of all active conversations with other users.
@@ -419,65 +477,59 @@ def get_conversations_list(
     Useful for displaying a chat/inbox interface.
     """
     
-    # Get all users the current user has messaged with
-    query = db.query(
-        Message.sender_id,
-        Message.receiver_id
-    ).filter(
-        or_(
-            Message.sender_id == current_user.id,
-            Message.receiver_id == current_user.id
-        )
-    ).all()
-    
-    # Collect unique user IDs (excluding current user)
-    user_ids = set()
-    for sender_id, receiver_id in query:
-        if sender_id != current_user.id:
-            user_ids.add(sender_id)
-        if receiver_id != current_user.id:
-            user_ids.add(receiver_id)
-    
-    conversations = []
-    
-    for user_id in user_ids:
-        # Get last message with this user
-        last_message = db.query(Message).filter(
-            or_(
-                and_(
-                    Message.sender_id == current_user.id,
-                    Message.receiver_id == user_id
-                ),
-                and_(
-                    Message.sender_id == user_id,
-                    Message.receiver_id == current_user.id
-                )
-            )
-        ).order_by(Message.created_at.desc()).first()
-        
-        # Count unread messages from this user
-        unread_count = db.query(Message).filter(
+    # One query for the whole inbox:
+    # - "peer" = the other person in each message
+    # - ROW_NUMBER() per peer (newest first) picks the last message (rn = 1)
+    # - COUNT(*) FILTER (...) per peer counts unread messages sent to us
+    # - one JOIN to users for the peer's username
+    peer = case(
+        (Message.sender_id == current_user.id, Message.receiver_id),
+        else_=Message.sender_id
+    ).label("peer")
+    
+    thread = select(
+        peer,
+        Message.message_text,
+        Message.created_at,
+        func.row_number().over(
+            partition_by=peer,
+            order_by=(Message.created_at.desc(), Message.id.desc())
+        ).label("rn"),
+        func.count().filter(
             and_(
-                Message.sender_id == user_id,
                 Message.receiver_id == current_user.id,
                 Message.is_read == False
             )
-        ).count()
-        
-        other_user = db.query(User).filter(User.id == user_id).first()
-        
-        conversations.append({
-            "user_id": user_id,
-            "username": other_user.username,
-            "last_message": last_message.message_text if last_message else "",
-            "last_message_time": last_message.created_at if last_message else None,
-            "unread_count": unread_count
-        })
-    
-    # Sort by last message time (newest first)
-    conversations.sort(
-        key=lambda x: x["last_message_time"] or datetime.min,
-        reverse=True
-    )
+        ).over(partition_by=peer).label("unread_count")
+    ).where(
+        or_(
+            Message.sender_id == current_user.id,
+            Message.receiver_id == current_user.id
+        )
+    ).subquery()
+    
+    # Sorted by last message time (newest first)
+    rows = (await db.execute(
+        select(
+            thread.c.peer,
+            User.username,
+            thread.c.message_text,
+            thread.c.created_at,
+            thread.c.unread_count
+        ).join(User, User.id == thread.c.peer).where(
+            thread.c.rn == 1
+        ).order_by(thread.c.created_at.desc())
+    )).all()
+    
+    conversations = [
+        {
+            "user_id": row.peer,
+            "username": row.username,
+            "last_message": row.message_text,
+            "last_message_time": row.created_at,
+            "unread_count": row.unread_count
+        }
+        for row in rows
+    ]
     
     return conversations
\ No newline at end of file
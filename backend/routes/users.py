@@ -22,16 +22,21 @@ FEATURES:
 - Search for sellers
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from pydantic import BaseModel
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, exists, case, cast, Float, tuple_
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
+from datetime import datetime, timezone
 from typing import Optional, List
+import orjson
 
 # Import models and dependencies
 from models import User, UserProfile, Review, SellerProof, Listing
-from routes.auth import get_db, get_current_user
+from db import get_db
+from routes.auth import get_current_user
+from routes.listings import invalidate_seller_listings
+from utils.redis_cache import get_redis, cache_get, cache_set, cache_delete
+from utils.search import contains_pattern
 
 # ============================================================================
 # PYDANTIC SCHEMAS
@@ -42,28 +47,30 @@ class UserProfileUpdateRequest(BaseModel):
     bio: Optional[str] = None
     profile_picture_url: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "bio": "Concert enthusiast! Selling extra tickets.",
                 "profile_picture_url": "https://example.com/photo.jpg"
             }
         }
+    )
 
 class ReviewCreateRequest(BaseModel):
     """Data to create a review"""
     listing_id: Optional[int] = None  # Which transaction is this for?
-    rating: int  # 1-5 stars
+    rating: int = Field(ge=1, le=5)  # 1-5 stars
     comment: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "listing_id": 42,
                 "rating": 5,
                 "comment": "Great seller! Fast communication, legitimate tickets."
             }
         }
+    )
 
 class ReviewResponse(BaseModel):
     """Review data"""
@@ -74,8 +81,7 @@ class ReviewResponse(BaseModel):
     comment: Optional[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SellerProofResponse(BaseModel):
     """Seller proof of past sales"""
@@ -84,8 +90,7 @@ class SellerProofResponse(BaseModel):
     description: Optional[str]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserProfileResponse(BaseModel):
     """Full user profile with stats"""
@@ -100,8 +105,7 @@ class UserProfileResponse(BaseModel):
     is_verified: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserPublicProfileResponse(BaseModel):
     """Public user profile (no email, no private info)"""
@@ -114,21 +118,21 @@ class UserPublicProfileResponse(BaseModel):
     is_verified_seller: bool
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SellerProofCreateRequest(BaseModel):
     """Data to upload seller proof"""
-    proof_image_url: str  # URL of screenshot
+    proof_image_url: HttpUrl  # URL of screenshot (must be http/https)
     description: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "proof_image_url": "https://example.com/proof.jpg",
                 "description": "Sold 2 Taylor Swift tickets on Ticketmaster"
             }
         }
+    )
 
 # ============================================================================
 # ROUTER
@@ -136,12 +140,111 @@ class SellerProofCreateRequest(BaseModel):
 
 router = APIRouter()
 
+# Read endpoints build plain dicts from our own rows and encode them with
+# orjson directly: response_model stays for the docs, but the per-field
+# Pydantic validation + jsonable_encoder pass is skipped
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+def _private_profile_dict(user: User, profile) -> dict:
+    """Matches UserProfileResponse (the owner's view, includes email); profile can be a UserProfile or a row"""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "bio": profile.bio,
+        "profile_picture_url": profile.profile_picture_url,
+        "total_sales": profile.total_sales,
+        "average_rating": profile.average_rating,
+        "is_verified_seller": profile.is_verified_seller,
+        "is_verified": user.is_verified,
+        "created_at": user.created_at
+    }
+
+# Redis cache (see utils/redis_cache.py)
+# Public profiles are read on every listing view; the cached body is
+# dropped when the profile is edited or the user gets a new review.
+PROFILE_CACHE_TTL = 60
+
+def _profile_key(user_id: int) -> str:
+    return f"profile:{user_id}"
+
+# Flat projections (no ORM objects)
+# Select just the columns each response needs and build dicts straight from
+# the rows: fewer bytes from Postgres and no ORM object per row.
+# _public_profile_select matches UserPublicProfileResponse.
+_public_profile_select = select(
+    User.id, User.username, User.created_at,
+    UserProfile.id.label("profile_id"),  # None when the user has no profile row
+    UserProfile.bio, UserProfile.profile_picture_url,
+    UserProfile.total_sales, UserProfile.average_rating, UserProfile.is_verified_seller,
+)
+
+def _public_profile_row_to_dict(row) -> dict:
+    """One result row -> the UserPublicProfileResponse JSON shape (missing profile -> defaults)"""
+    return {
+        "id": row.id,
+        "username": row.username,
+        "bio": row.bio,
+        "profile_picture_url": row.profile_picture_url,
+        "total_sales": row.total_sales or 0,
+        "average_rating": row.average_rating or 0.0,
+        "is_verified_seller": bool(row.is_verified_seller),
+        "created_at": row.created_at
+    }
+
+# ============================================================================
+# SEARCH USERS
+# ============================================================================
+# Declared BEFORE /{user_id}: routes match in order, and "/search" would
+# otherwise be taken as user_id="search" (422)
+
+@router.get("/search", response_model=List[UserPublicProfileResponse])
+async def search_users(
+    query: str = Query(..., min_length=1, max_length=50, description="Search by username"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=50),
+    verified_only: bool = Query(False, description="Only verified sellers"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search for users by username.
+    
+    FILTERS:
+    - query: Search term (case-insensitive)
+    - verified_only: Only return verified sellers
+    
+    Returns public profile info.
+    """
+    
+    # '%query%' can't use a normal B-tree index (leading wildcard);
+    # ix_users_username_trgm (pg_trgm, see schema.sql) serves this ILIKE.
+    # % and _ in the query are escaped so they match literally.
+    search_term = contains_pattern(query)
+    
+    # Users + their profiles in ONE query (no extra SELECT per user)
+    # Outer join keeps users without a profile; verified_only needs a
+    # profile anyway, so it uses an inner join
+    user_query = _public_profile_select
+    if verified_only:
+        user_query = user_query.join(
+            UserProfile, UserProfile.user_id == User.id
+        ).where(UserProfile.is_verified_seller == True)
+    else:
+        user_query = user_query.outerjoin(UserProfile, UserProfile.user_id == User.id)
+    
+    rows = (await db.execute(
+        user_query.where(User.username.ilike(search_term, escape="\\")).offset(skip).limit(limit)
+    )).all()
+    
+    return _json_response(orjson.dumps([_public_profile_row_to_dict(row) for row in rows]))
+
 # ============================================================================
 # GET USER PROFILE (Public)
 # ============================================================================
 
 @router.get("/{user_id}", response_model=UserPublicProfileResponse)
-def get_user_profile(user_id: int, db: Session = Depends(get_db)):
+async def get_user_profile(user_id: int, db: AsyncSession = Depends(get_db), r = Depends(get_redis)):
     """
     Get public profile of a user.
     
@@ -153,44 +256,47 @@ def get_user_profile(user_id: int, db: Session = Depends(get_db)):
     Does NOT show:
     - Email address
     - Private profile info
+    
+    Cached in Redis for PROFILE_CACHE_TTL seconds.
     """
     
-    user = db.query(User).filter(User.id == user_id).first()
+    cached = await cache_get(r, _profile_key(user_id))
+    if cached is not None:
+        return _json_response(cached)
     
-    if not user:
+    # User + profile stats in ONE round trip (outer join so a missing
+    # profile still tells us whether the user exists)
+    row = (await db.execute(
+        _public_profile_select.outerjoin(
+            UserProfile, UserProfile.user_id == User.id
+        ).where(User.id == user_id)
+    )).first()
+    
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    # Get profile stats
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-    
-    if not profile:
+    if row.profile_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found"
         )
     
-    return {
-        "id": user.id,
-        "username": user.username,
-        "bio": profile.bio,
-        "profile_picture_url": profile.profile_picture_url,
-        "total_sales": profile.total_sales,
-        "average_rating": profile.average_rating,
-        "is_verified_seller": profile.is_verified_seller,
-        "created_at": user.created_at
-    }
+    body = orjson.dumps(_public_profile_row_to_dict(row))
+    await cache_set(r, _profile_key(user_id), body, PROFILE_CACHE_TTL)
+    
+    return _json_response(body)
 
 # ============================================================================
 # GET CURRENT USER PROFILE (Private)
 # ============================================================================
 
 @router.get("/me/profile", response_model=UserProfileResponse)
-def get_current_user_profile(
+async def get_current_user_profile(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get current user's full profile (with private info).
@@ -200,7 +306,7 @@ def get_current_user_profile(
     Shows everything including email address.
     """
     
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    profile = await db.scalar(select(UserProfile).where(UserProfile.user_id == current_user.id))
     
     if not profile:
         raise HTTPException(
@@ -208,28 +314,19 @@ def get_current_user_profile(
             detail="Profile not found"
         )
     
-    return {
-        "id": current_user.id,
-        "username": current_user.username,
-        "email": current_user.email,
-        "bio": profile.bio,
-        "profile_picture_url": profile.profile_picture_url,
-        "total_sales": profile.total_sales,
-        "average_rating": profile.average_rating,
-        "is_verified_seller": profile.is_verified_seller,
-        "is_verified": current_user.is_verified,
-        "created_at": current_user.created_at
-    }
+    return _json_response(orjson.dumps(_private_profile_dict(current_user, profile)))
 
 # ============================================================================
 # UPDATE CURRENT USER PROFILE
 # ============================================================================
 
 @router.put("/me", response_model=UserProfileResponse)
-def update_user_profile(
+async def update_user_profile(
     request: UserProfileUpdateRequest,
+    http_request: Request,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Update current user's profile.
@@ -241,49 +338,51 @@ def update_user_profile(
     - profile_picture_url (link to photo)
     """
     
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
+    # Update fields if provided
+    values = {}
+    if request.bio is not None:
+        values["bio"] = request.bio
     
-    if not profile:
+    if request.profile_picture_url is not None:
+        values["profile_picture_url"] = request.profile_picture_url
+    
+    # ONE statement: UPDATE user_profiles ... WHERE user_id = me RETURNING ...
+    # (no SELECT first; updated_at is set to UTC now() by the column's onupdate)
+    profile = (await db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == current_user.id)
+        .values(**values)
+        .returning(
+            UserProfile.bio, UserProfile.profile_picture_url,
+            UserProfile.total_sales, UserProfile.average_rating, UserProfile.is_verified_seller,
+        )
+    )).first()
+    
+    if profile is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
     
-    # Update fields if provided
-    if request.bio is not None:
-        profile.bio = request.bio
+    await db.commit()
     
-    if request.profile_picture_url is not None:
-        profile.profile_picture_url = request.profile_picture_url
+    # Cached /api/auth/me responses and the public profile are now stale
+    http_request.app.state.auth_cache.forget_user(current_user.id)
+    await cache_delete(r, _profile_key(current_user.id))
     
-    profile.updated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(profile)
-    
-    return {
-        "id": current_user.id,
-        "username": current_user.username,
-        "email": current_user.email,
-        "bio": profile.bio,
-        "profile_picture_url": profile.profile_picture_url,
-        "total_sales": profile.total_sales,
-        "average_rating": profile.average_rating,
-        "is_verified_seller": profile.is_verified_seller,
-        "is_verified": current_user.is_verified,
-        "created_at": current_user.created_at
-    }
+    return _json_response(orjson.dumps(_private_profile_dict(current_user, profile)))
 
 # ============================================================================
 # LEAVE REVIEW FOR SELLER
 # ============================================================================
 
 @router.post("/{user_id}/reviews", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
-def create_review(
+async def create_review(
     user_id: int,
     request: ReviewCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    r = Depends(get_redis)
 ):
     """
     Leave a review/rating for a seller.
@@ -291,10 +390,8 @@ def create_review(
     REQUIRES: Valid JWT token
     
     Flow:
-    1. Validate rating is 1-5
-    2. Validate seller exists
-    3. Create review
-    4. Update seller's average rating
+    1. Validate seller exists (rating 1-5 is checked by ReviewCreateRequest)
+    2. Create review + update seller's rating (one transaction)
     
     Use case: After buying tickets from seller, leave review.
     """
@@ -306,16 +403,8 @@ def create_review(
             detail="Cannot review yourself"
         )
     
-    # Validate rating
-    if request.rating < 1 or request.rating > 5:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Rating must be between 1 and 5"
-        )
-    
-    # Check if seller exists
-    seller = db.query(User).filter(User.id == user_id).first()
-    if not seller:
+    # Check if seller exists (SELECT EXISTS — just a boolean, no row)
+    if not await db.scalar(select(exists().where(User.id == user_id))):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Seller not found"
@@ -323,8 +412,7 @@ def create_review(
     
     # If listing_id provided, verify it exists
     if request.listing_id:
-        listing = db.query(Listing).filter(Listing.id == request.listing_id).first()
-        if not listing:
+        if not await db.scalar(select(exists().where(Listing.id == request.listing_id))):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Listing not found"
@@ -340,11 +428,36 @@ def create_review(
     )
     
     db.add(new_review)
-    db.commit()
-    db.refresh(new_review)
+    await db.flush()  # INSERT now (id + created_at come back via RETURNING), commit below
+    
+    # Update seller's rating in ONE statement using the running totals
+    # (no AVG/COUNT over every review). All SET expressions see the OLD
+    # row, so the new values are written out as old + this review.
+    new_sum = UserProfile.rating_sum + request.rating
+    new_count = UserProfile.rating_count + 1
+    new_average = cast(new_sum, Float) / new_count
+    await db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == user_id)
+        .values(
+            rating_sum=new_sum,
+            rating_count=new_count,
+            average_rating=new_average,
+            # Auto-verify as seller once there are enough good ratings
+            is_verified_seller=case(
+                ((new_count >= 5) & (new_average >= 4.5), True),
+                else_=UserProfile.is_verified_seller
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+    # Review + rating land in ONE transaction (one commit, and never a
+    # review without its rating update)
+    await db.commit()
     
-    # Update seller's average rating
-    update_seller_rating(user_id, db)
+    # The seller's cached public profile and listing pages show the old rating
+    await cache_delete(r, _profile_key(user_id))
+    await invalidate_seller_listings(r, db, user_id)
     
     return {
         "id": new_review.id,
@@ -360,11 +473,11 @@ def create_review(
 # ============================================================================
 
 @router.get("/{user_id}/reviews", response_model=List[ReviewResponse])
-def get_user_reviews(
+async def get_user_reviews(
     user_id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=50),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all reviews for a user (seller).
@@ -378,42 +491,38 @@ def get_user_reviews(
     Paginated, newest first.
     """
     
-    # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # Check if user exists (SELECT EXISTS — just a boolean, no row)
+    if not await db.scalar(select(exists().where(User.id == user_id))):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    reviews = db.query(Review).filter(
-        Review.reviewed_user_id == user_id
-    ).order_by(Review.created_at.desc()).offset(skip).limit(limit).all()
-    
-    # Add reviewer username to each review
-    result = []
-    for review in reviews:
-        reviewer = db.query(User).filter(User.id == review.reviewer_id).first()
-        result.append({
-            "id": review.id,
-            "reviewer_id": review.reviewer_id,
-            "reviewer_username": reviewer.username if reviewer else "Unknown",
-            "rating": review.rating,
-            "comment": review.comment,
-            "created_at": review.created_at
-        })
-    
-    return result
+    # Reviews + reviewer usernames in ONE query (JOIN users), instead of
+    # one extra SELECT per review for the username
+    # Only the ReviewResponse columns (no ORM objects)
+    rows = (await db.execute(
+        select(
+            Review.id, Review.reviewer_id, User.username.label("reviewer_username"),
+            Review.rating, Review.comment, Review.created_at,
+        ).join(
+            User, User.id == Review.reviewer_id
+        ).where(
+            Review.reviewed_user_id == user_id
+        ).order_by(Review.created_at.desc()).offset(skip).limit(limit)
+    )).all()
+    
+    return _json_response(orjson.dumps([row._asdict() for row in rows]))
 
 # ============================================================================
 # UPLOAD SELLER PROOF
 # ============================================================================
 
 @router.post("/me/proof", response_model=SellerProofResponse, status_code=status.HTTP_201_CREATED)
-def upload_seller_proof(
+async def upload_seller_proof(
     request: SellerProofCreateRequest,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Upload proof of past sales to build seller credibility.
@@ -430,13 +539,12 @@ def upload_seller_proof(
     
     new_proof = SellerProof(
         seller_id=current_user.id,
-        proof_image_url=request.proof_image_url,
+        proof_image_url=str(request.proof_image_url),
         description=request.description
     )
     
     db.add(new_proof)
-    db.commit()
-    db.refresh(new_proof)
+    await db.commit()  # id + created_at come back via RETURNING
     
     return {
         "id": new_proof.id,
@@ -450,109 +558,58 @@ def upload_seller_proof(
 # ============================================================================
 
 @router.get("/{user_id}/proof", response_model=List[SellerProofResponse])
-def get_seller_proof(user_id: int, db: Session = Depends(get_db)):
+async def get_seller_proof(
+    user_id: int,
+    before_created: Optional[datetime] = Query(None, description="Cursor: created_at of the last proof you got"),
+    before_id: Optional[int] = Query(None, description="Cursor: id of the last proof you got"),
+    limit: int = Query(20, ge=1, le=100, description="Return max N proof images"),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Get all proof images for a seller.
+    Get proof images for a seller, newest first.
     
     Shows evidence of past legitimate sales.
     Helps buyers verify seller credibility.
+    
+    PAGINATION (keyset / cursor):
+    - limit: How many to return (max 100)
+    - before_created + before_id: the created_at and id of the LAST proof on
+      the previous page; leave both out for the first page
     """
     
-    # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    if (before_created is None) != (before_id is None):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before_created and before_id must be used together"
         )
     
-    proof_images = db.query(SellerProof).filter(
-        SellerProof.seller_id == user_id
-    ).order_by(SellerProof.created_at.desc()).all()
-    
-    return proof_images
-
-# ============================================================================
-# SEARCH USERS
-# ============================================================================
-
-@router.get("/search", response_model=List[UserPublicProfileResponse])
-def search_users(
-    query: str = Query(..., min_length=1, max_length=50, description="Search by username"),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(10, ge=1, le=50),
-    verified_only: bool = Query(False, description="Only verified sellers"),
-    db: Session = Depends(get_db)
-):
-    """
-    Search for users by username.
-    
-    FILTERS:
-    - query: Search term (case-insensitive)
-    - verified_only: Only return verified sellers
-    
-    Returns public profile info.
-    """
-    
-    search_term = f"%{query}%"
+    # created_at is a naive UTC timestamp; asyncpg refuses to compare it with
+    # an aware value (e.g. "...Z" or "+02:00"), so convert those to naive UTC
+    if before_created is not None and before_created.tzinfo is not None:
+        before_created = before_created.astimezone(timezone.utc).replace(tzinfo=None)
     
-    user_query = db.query(User).filter(
-        User.username.ilike(search_term)
-    )
-    
-    # Filter by verified sellers
-    if verified_only:
-        user_query = user_query.join(UserProfile).filter(
-            UserProfile.is_verified_seller == True
+    # Check if user exists (SELECT EXISTS — just a boolean, no row)
+    if not await db.scalar(select(exists().where(User.id == user_id))):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
         )
     
-    users = user_query.offset(skip).limit(limit).all()
-    
-    result = []
-    for user in users:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user.id).first()
-        result.append({
-            "id": user.id,
-            "username": user.username,
-            "bio": profile.bio if profile else None,
-            "profile_picture_url": profile.profile_picture_url if profile else None,
-            "total_sales": profile.total_sales if profile else 0,
-            "average_rating": profile.average_rating if profile else 0,
-            "is_verified_seller": profile.is_verified_seller if profile else False,
-            "created_at": user.created_at
-        })
+    # Only the SellerProofResponse columns (no ORM objects)
+    query = select(
+        SellerProof.id, SellerProof.proof_image_url,
+        SellerProof.description, SellerProof.created_at,
+    ).where(SellerProof.seller_id == user_id)
     
-    return result
-
-# ============================================================================
-# HELPER FUNCTION
-# ============================================================================
-
-def update_seller_rating(user_id: int, db: Session):
-    """
-    Calculate and update seller's average rating based on all reviews.
-    
-    Called after each new review is added.
-    """
-    
-    # Get average rating from all reviews
-    avg_rating = db.query(func.avg(Review.rating)).filter(
-        Review.reviewed_user_id == user_id
-    ).scalar()
+    # Keyset pagination: everything older than the cursor, in the same order
+    if before_created is not None:
+        query = query.where(
+            tuple_(SellerProof.created_at, SellerProof.id) < tuple_(before_created, before_id)
+        )
     
-    # Get profile and update
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+    # Newest first; id breaks ties so the cursor is exact
+    rows = (await db.execute(
+        query.order_by(SellerProof.created_at.desc(), SellerProof.id.desc()).limit(limit)
+    )).all()
     
-    if profile:
-        profile.average_rating = float(avg_rating) if avg_rating else 0
-        
-        # Auto-verify as seller if enough ratings
-        review_count = db.query(Review).filter(
-            Review.reviewed_user_id == user_id
-        ).count()
-        
-        if review_count >= 5 and profile.average_rating >= 4.5:
-            profile.is_verified_seller = True
-        
-        profile.updated_at = datetime.utcnow()
-        db.commit()
\ No newline at end of file
+    return _json_response(orjson.dumps([row._asdict() for row in rows]))
@@ -0,0 +1,31 @@
+"""
+Auth Cache
+==========
+
+In-memory caches used on the authentication path.
+
+One AuthCache instance is created in app.py and stored on app.state, so
+routes reach it through `request.app.state.auth_cache` instead of module
+globals (each app — including test apps — gets its own, fresh caches).
+
+WHAT WE CACHE:
+- tokens: raw JWT -> (user_id, exp)   skips the signature check + decode
+- users:  user_id -> User             skips the SELECT on users
+- me:     user_id -> bytes            the ready-to-send /api/auth/me body
+"""
+
+from cachetools import TTLCache
+
+
+class AuthCache:
+    """Per-process caches for get_current_user and /api/auth/me"""
+
+    def __init__(self, maxsize: int = 10_000, token_ttl: int = 60, user_ttl: int = 30):
+        self.tokens = TTLCache(maxsize=maxsize, ttl=token_ttl)
+        self.users = TTLCache(maxsize=maxsize, ttl=user_ttl)
+        self.me = TTLCache(maxsize=maxsize, ttl=user_ttl)
+
+    def forget_user(self, user_id: int):
+        """Drop everything cached for a user (call after the user changes)"""
+        self.users.pop(user_id, None)
+        self.me.pop(user_id, None)
@@ -0,0 +1,89 @@
+"""
+Redis Cache
+===========
+
+Shared response cache for read-heavy endpoints (listings browse, unread count).
+
+WHY REDIS (and not an in-process dict):
+- Every worker process sees the same cache
+- A write in one worker (create/update/delete listing) can invalidate
+  the cached pages for all workers
+
+OPTIONAL:
+- Set REDIS_URL (e.g. redis://localhost:6379/0) to turn caching on
+- Without it, get_redis() returns None and every helper below is a no-op,
+  so the app behaves exactly as before
+- Redis errors are swallowed: a broken cache means a DB query, not a 500
+
+Usage in a route (the client is redis.asyncio, so every helper is awaited):
+    from utils.redis_cache import get_redis, cache_get, cache_set
+
+    @router.get("/things")
+    async def get_things(r = Depends(get_redis), db: AsyncSession = Depends(get_db)):
+        cached = await cache_get(r, "things")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        ...
+"""
+
+from typing import Optional
+
+import redis
+import redis.asyncio
+
+from config import REDIS_URL
+
+# ============================================================================
+# CLIENT (one connection pool per worker)
+# ============================================================================
+
+# Short timeouts: if Redis is slow we'd rather skip the cache than wait on it
+redis_client = (
+    redis.asyncio.Redis.from_url(REDIS_URL, socket_timeout=0.1, socket_connect_timeout=0.1)
+    if REDIS_URL else None
+)
+
+def get_redis() -> Optional[redis.asyncio.Redis]:
+    """Dependency: the shared Redis client, or None when caching is off"""
+    return redis_client
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+async def cache_get(r: Optional[redis.asyncio.Redis], key: str) -> Optional[bytes]:
+    """Return the cached bytes for key, or None on a miss"""
+    if r is None:
+        return None
+    try:
+        return await r.get(key)
+    except redis.RedisError:
+        return None
+
+async def cache_set(r: Optional[redis.asyncio.Redis], key: str, value: bytes, ttl: int):
+    """Store bytes under key for ttl seconds"""
+    if r is None:
+        return
+    try:
+        await r.set(key, value, ex=ttl)
+    except redis.RedisError:
+        pass
+
+async def cache_delete(r: Optional[redis.asyncio.Redis], *keys: str, pattern: Optional[str] = None):
+    """
+    Delete specific keys and/or every key matching a glob pattern.
+
+    SCAN (not KEYS) walks the keyspace in small batches so Redis
+    isn't blocked while we sweep.
+    """
+    if r is None:
+        return
+    try:
+        if keys:
+            await r.delete(*keys)
+        if pattern:
+            matched = [key async for key in r.scan_iter(match=pattern, count=500)]
+            if matched:
+                await r.delete(*matched)
+    except redis.RedisError:
+        pass
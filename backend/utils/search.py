@@ -0,0 +1,23 @@
+"""
+Search Helpers
+==============
+
+Shared helpers for the ILIKE searches in the listings and users routes.
+
+Usage (pass escape="\\" to ilike so the escaping is honoured):
+    from utils.search import contains_pattern
+
+    query.where(User.username.ilike(contains_pattern(text), escape="\\"))
+"""
+
+
+def contains_pattern(text: str) -> str:
+    """
+    Turn user search text into an ILIKE "contains" pattern.
+    
+    % and _ typed by the user are escaped so they match literally instead of
+    acting as wildcards (a search for "%" would otherwise match every row
+    and make the trigram index useless).
+    """
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"